@@ -1,29 +1,114 @@
+import json
 import streamlit as st
 import pandas as pd
 import numpy as np
 from utils import (
     load_model,
-    extract_text_from_file,
     preprocess_text,
     get_embeddings,
-    calculate_cosine_similarity,
+    top_k_matches,
+    content_hash,
+    get_embedding_cache,
+    DEFAULT_BATCH_SIZE,
+    BACKENDS,
+    embedding_model_key,
+    check_backend_parity,
 )
+from extraction import DEFAULT_TIMEOUT_SECONDS, extract_texts_parallel
+from reembedding import ReembeddingJob
+from resume_store import ResumeStore
 
 # --- Page Configuration ---
 st.set_page_config(layout="wide", page_title="ResuStreamPro")
 
 # --- Initialize Session State ---
-if "resumes_data" not in st.session_state:
-    st.session_state.resumes_data = []  # List to store {filename, raw_text, processed_text, embedding}
+if "resume_store" not in st.session_state:
+    # Columnar store of uploaded resumes with one embedding matrix per model key
+    st.session_state.resume_store = ResumeStore()
+if "reembedding_jobs" not in st.session_state:
+    st.session_state.reembedding_jobs = {}  # Background ReembeddingJob per model name
+if "store_generation" not in st.session_state:
+    st.session_state.store_generation = 0  # Bumped on clear so stale jobs are discarded
+if "max_results" not in st.session_state:
+    st.session_state.max_results = 50
 if "selected_model_name" not in st.session_state:
     st.session_state.selected_model_name = "all-MiniLM-L6-v2"  # Default model
+if "selected_backend" not in st.session_state:
+    st.session_state.selected_backend = "torch"  # Plain fp32 PyTorch
 if "matching_threshold" not in st.session_state:
     st.session_state.matching_threshold = 0.70
+if "chunk_pooling" not in st.session_state:
+    st.session_state.chunk_pooling = None  # None truncates; "mean"/"max" chunk long resumes
+if "extraction_timeout" not in st.session_state:
+    st.session_state.extraction_timeout = DEFAULT_TIMEOUT_SECONDS
+if "embedding_batch_size" not in st.session_state:
+    st.session_state.embedding_batch_size = DEFAULT_BATCH_SIZE
 if "model" not in st.session_state:
-    st.session_state.model = load_model(st.session_state.selected_model_name)
+    st.session_state.model = load_model(
+        st.session_state.selected_model_name, st.session_state.selected_backend
+    )
 if "current_page" not in st.session_state:
     st.session_state.current_page = "Home"
 
+
+def active_model_key():
+    """Key of the embedding store and cache for the selected model and backend."""
+    return embedding_model_key(
+        st.session_state.selected_model_name,
+        st.session_state.selected_backend,
+        st.session_state.chunk_pooling,
+    )
+
+
+def sync_embedding_store():
+    """Merges finished re-embedding jobs and starts one for any missing rows."""
+    store = st.session_state.resume_store
+    model_name = active_model_key()
+    job = st.session_state.reembedding_jobs.get(model_name)
+    if job is not None:
+        if job.is_running():
+            return
+        del st.session_state.reembedding_jobs[model_name]
+        if job.error is not None:
+            st.error(f"Re-embedding with {model_name} failed: {job.error}")
+            return
+        if (
+            job.generation == st.session_state.store_generation
+            and job.start_row == store.embedded_count(model_name)
+        ):
+            store.append_embeddings(model_name, job.result)
+
+    start_row = store.embedded_count(model_name)
+    if start_row < len(store) and st.session_state.model is not None:
+        st.session_state.reembedding_jobs[model_name] = ReembeddingJob(
+            model_name,
+            st.session_state.model,
+            [store.processed_text(i) for i in range(start_row, len(store))],
+            start_row,
+            st.session_state.store_generation,
+            cache=get_embedding_cache(),
+            batch_size=st.session_state.embedding_batch_size,
+            pooling=st.session_state.chunk_pooling,
+        ).start()
+
+
+@st.fragment(run_every=1.0)
+def reembedding_progress():
+    """Shows progress of the selected model's background job and reruns when it ends."""
+    job = st.session_state.reembedding_jobs.get(active_model_key())
+    if job is None:
+        return
+    if job.is_running():
+        st.progress(
+            job.progress,
+            text=f"Re-embedding {job.completed}/{job.total} resumes with {job.model_name}...",
+        )
+    else:
+        st.rerun()  # Full rerun so the finished job is merged into the store
+
+
+sync_embedding_store()
+
 # --- Sidebar ---
 with st.sidebar:
     st.title("ResuStreamPro")
@@ -52,10 +137,32 @@ with st.sidebar:
     if new_model_name != st.session_state.selected_model_name:
         st.session_state.selected_model_name = new_model_name
         with st.spinner(f"Loading model: {st.session_state.selected_model_name}..."):
-            st.session_state.model = load_model(st.session_state.selected_model_name)
+            st.session_state.model = load_model(
+                st.session_state.selected_model_name, st.session_state.selected_backend
+            )
         st.success(f"Model '{st.session_state.selected_model_name}' loaded.")
         st.rerun()  # Rerun to reflect model change immediately
 
+    # Inference backend selection; ONNX backends are exported once and cached on disk
+    new_backend = st.selectbox(
+        "Inference Backend",
+        options=BACKENDS,
+        index=BACKENDS.index(st.session_state.selected_backend),
+        help="onnx and onnx-int8 are faster on CPU-only hosts. Check their drift on the Settings page.",
+    )
+    if new_backend != st.session_state.selected_backend:
+        st.session_state.selected_backend = new_backend
+        with st.spinner(f"Preparing {new_backend} backend..."):
+            st.session_state.model = load_model(
+                st.session_state.selected_model_name, st.session_state.selected_backend
+            )
+        st.rerun()
+
+    # Resumes missing from this model's store are embedded in the background;
+    # the poller is only rendered while a job exists, so idle sessions never rerun
+    if active_model_key() in st.session_state.reembedding_jobs:
+        reembedding_progress()
+
     # Matching Threshold
     st.session_state.matching_threshold = st.slider(
         "Matching Threshold", 0.0, 1.0, st.session_state.matching_threshold, 0.01
@@ -75,7 +182,10 @@ if st.session_state.current_page == "Home":
             "The AI model could not be loaded. Please check the model selection or try again."
         )
     else:
-        st.info(f"Currently using AI model: **{st.session_state.selected_model_name}**")
+        st.info(
+            f"Currently using AI model: **{st.session_state.selected_model_name}** "
+            f"({st.session_state.selected_backend} backend)"
+        )
 
 # Upload Page
 elif st.session_state.current_page == "Upload":
@@ -89,57 +199,97 @@ elif st.session_state.current_page == "Upload":
     )
 
     if uploaded_files:
-        newly_uploaded_filenames = [f.name for f in uploaded_files]
-        existing_filenames = [r["filename"] for r in st.session_state.resumes_data]
+        store = st.session_state.resume_store
+        seen_hashes = set()
 
-        processed_count = 0
+        # Phase 1: extract and preprocess text for every new file, in parallel.
+        new_files = []
         for uploaded_file in uploaded_files:
-            if uploaded_file.name not in existing_filenames:
-                with st.spinner(f"Processing {uploaded_file.name}..."):
-                    raw_text = extract_text_from_file(uploaded_file)
-                    if raw_text and raw_text.strip():
-                        processed_text = preprocess_text(raw_text)
-                        embedding = get_embeddings(
-                            processed_text, st.session_state.model
-                        )
-                        if embedding is not None:
-                            st.session_state.resumes_data.append(
-                                {
-                                    "filename": uploaded_file.name,
-                                    "raw_text": raw_text,
-                                    "processed_text": processed_text,
-                                    "embedding": embedding.cpu(),  # Store on CPU
-                                }
-                            )
-                            processed_count += 1
-                        else:
-                            st.warning(
-                                f"Could not generate embedding for {uploaded_file.name}. Skipping."
-                            )
-                    else:
-                        st.warning(
-                            f"No text extracted or empty content in {uploaded_file.name}. Skipping."
-                        )
+            file_bytes = uploaded_file.getvalue()
+            file_hash = content_hash(file_bytes)
+            if not store.has_hash(file_hash) and file_hash not in seen_hashes:
+                seen_hashes.add(file_hash)  # Also skips duplicates within this upload
+                new_files.append((uploaded_file.name, file_hash, file_bytes))
             else:
                 st.info(
                     f"Resume '{uploaded_file.name}' has already been uploaded and processed."
                 )
 
-        if processed_count > 0:
-            st.success(
-                f"Successfully processed and embedded {processed_count} new resume(s)."
-            )
+        extracted = {}
+        if new_files:
+            progress_bar = st.progress(0.0, text="Extracting text...")
+            status_table = st.empty()
+            statuses = []
+            for result in extract_texts_parallel(
+                [(name, data) for name, _, data in new_files],
+                timeout=st.session_state.extraction_timeout,
+            ):
+                filename, file_hash, _ = new_files[result.index]
+                if result.error:
+                    status = f"Failed: {result.error}"
+                    st.warning(f"Could not extract text from {filename}: {result.error}. Skipping.")
+                elif not result.text.strip():
+                    status = "Empty"
+                    st.warning(
+                        f"No text extracted or empty content in {filename}. Skipping."
+                    )
+                else:
+                    status = "Extracted"
+                    extracted[result.index] = {
+                        "filename": filename,
+                        "content_hash": file_hash,
+                        "raw_text": result.text,
+                        "processed_text": preprocess_text(result.text),
+                    }
+                statuses.append({"File": filename, "Status": status})
+                progress_bar.progress(
+                    len(statuses) / len(new_files),
+                    text=f"Extracted {len(statuses)}/{len(new_files)} files",
+                )
+                status_table.dataframe(pd.DataFrame(statuses), use_container_width=True)
+            progress_bar.empty()
+
+        # Keep upload order regardless of which worker finished first.
+        pending_resumes = [extracted[i] for i in sorted(extracted)]
+
+        # Phase 2: embed all new resumes in one batched pass.
+        if pending_resumes:
+            with st.spinner(f"Embedding {len(pending_resumes)} resume(s)..."):
+                embeddings = get_embeddings(
+                    [r["processed_text"] for r in pending_resumes],
+                    st.session_state.model,
+                    batch_size=st.session_state.embedding_batch_size,
+                    model_name=active_model_key(),
+                    pooling=st.session_state.chunk_pooling,
+                )
+            if embeddings is not None:
+                model_name = active_model_key()
+                # Only append when the store is complete; otherwise a background
+                # job is still filling earlier rows and will pick these up too.
+                store_complete = store.embedded_count(model_name) == len(store)
+                for resume in pending_resumes:
+                    store.add(resume["filename"], resume["content_hash"], resume["raw_text"])
+                if store_complete:
+                    store.append_embeddings(model_name, embeddings)
+                sync_embedding_store()
+                st.success(
+                    f"Successfully processed and embedded {len(pending_resumes)} new resume(s)."
+                )
+            else:
+                st.warning("Could not generate embeddings for the new resumes. Skipping.")
 
     st.subheader("Uploaded Resumes")
-    if not st.session_state.resumes_data:
+    if not len(st.session_state.resume_store):
         st.info("No resumes uploaded yet.")
     else:
-        filenames = [resume["filename"] for resume in st.session_state.resumes_data]
+        filenames = st.session_state.resume_store.filenames
         df_resumes = pd.DataFrame({"Uploaded Resume Filenames": filenames})
         st.dataframe(df_resumes, use_container_width=True)
 
         if st.button("Clear All Uploaded Resumes"):
-            st.session_state.resumes_data = []
+            st.session_state.resume_store.clear()
+            st.session_state.reembedding_jobs = {}
+            st.session_state.store_generation += 1
             st.success("All uploaded resumes have been cleared.")
             st.rerun()
 
@@ -148,12 +298,27 @@ elif st.session_state.current_page == "Upload":
 elif st.session_state.current_page == "Dashboard":
     st.header("Candidate Dashboard")
 
-    if not st.session_state.resumes_data:
+    store = st.session_state.resume_store
+    if not len(store):
         st.warning("Please upload resumes first on the 'Upload' page.")
     else:
         job_description = st.text_area(
             "Enter Job Description", height=200, key="jd_input"
         )
+        embedded = store.embedded_count(active_model_key())
+        if embedded < len(store):
+            st.info(
+                f"{embedded} of {len(store)} resumes are embedded with "
+                f"{active_model_key()} so far. Matching covers those until "
+                "background re-embedding finishes."
+            )
+        st.session_state.max_results = st.number_input(
+            "Maximum candidates to show",
+            min_value=1,
+            value=st.session_state.max_results,
+            step=1,
+            help="Only the best-scoring candidates are ranked and shown.",
+        )
 
         if st.button("Match Candidates", type="primary"):
             if not job_description.strip():
@@ -167,41 +332,28 @@ elif st.session_state.current_page == "Dashboard":
                     "Processing job description and matching candidates..."
                 ):
                     processed_jd = preprocess_text(job_description)
-                    jd_embedding = get_embeddings(processed_jd, st.session_state.model)
+                    jd_embedding = get_embeddings(
+                        processed_jd,
+                        st.session_state.model,
+                        model_name=active_model_key(),
+                        pooling=st.session_state.chunk_pooling,
+                    )
 
                     if jd_embedding is not None:
-                        results = []
-                        for resume_data in st.session_state.resumes_data:
-                            if resume_data["embedding"] is not None:
-                                similarity_score = calculate_cosine_similarity(
-                                    jd_embedding.cpu(),  # Ensure JD embedding is on CPU for comparison
-                                    resume_data[
-                                        "embedding"
-                                    ].cpu(),  # Ensure resume embedding is on CPU
-                                )
-                                results.append(
-                                    {
-                                        "Filename": resume_data["filename"],
-                                        "Similarity Score": float(
-                                            similarity_score[0][0]
-                                        ),
-                                        "Processed Text": resume_data[
-                                            "processed_text"
-                                        ],  # For display/debug
-                                    }
-                                )
-                            else:
-                                results.append(
-                                    {
-                                        "Filename": resume_data["filename"],
-                                        "Similarity Score": 0.0,  # Or some indicator of error
-                                        "Processed Text": "Error: Embedding not available",
-                                    }
-                                )
-
-                        ranked_results = sorted(
-                            results, key=lambda x: x["Similarity Score"], reverse=True
+                        top_indices, top_scores = top_k_matches(
+                            store.embeddings(active_model_key()),
+                            jd_embedding,
+                            st.session_state.max_results,
                         )
+                        ranked_results = [
+                            {
+                                "Filename": store.filename(i),
+                                "Similarity Score": float(score),
+                                # For display/debug
+                                "Processed Text": store.processed_text(i),
+                            }
+                            for i, score in zip(top_indices, top_scores)
+                        ]
 
                         # Filter by threshold
                         filtered_results = [
@@ -233,7 +385,7 @@ elif st.session_state.current_page == "Dashboard":
                             )
 
                             st.subheader("Candidate Details")
-                            for res in filtered_results:
+                            for rank, res in enumerate(filtered_results):
                                 with st.expander(
                                     f"{res['Filename']} (Score: {res['Similarity Score']:.3f})"
                                 ):
@@ -242,7 +394,7 @@ elif st.session_state.current_page == "Dashboard":
                                         value=res["Processed Text"][:1000] + "...",
                                         height=150,
                                         disabled=True,
-                                        key=f"details_{res['Filename']}",
+                                        key=f"details_{rank}",  # Filenames are not unique across uploads
                                     )
                     else:
                         st.error("Could not process the job description.")
@@ -272,6 +424,104 @@ elif st.session_state.current_page == "Settings":
     )
     st.info(f"Current matching threshold: {st.session_state.matching_threshold:.2f}")
 
+    st.markdown("---")
+    st.subheader("Extraction")
+    st.session_state.extraction_timeout = st.number_input(
+        "Per-file extraction timeout (seconds)",
+        min_value=5,
+        max_value=600,
+        value=st.session_state.extraction_timeout,
+        step=5,
+        help="Files are extracted in parallel worker processes; a file that takes longer is skipped.",
+    )
+
+    st.markdown("---")
+    st.subheader("Embedding")
+    st.session_state.embedding_batch_size = st.select_slider(
+        "Embedding batch size",
+        options=[8, 16, 32, 64, 128],
+        value=st.session_state.embedding_batch_size,
+        help="Number of resumes encoded per model call during upload. Larger batches are faster on CPU but use more memory.",
+    )
+
+    long_resume_modes = {
+        "Truncate (first 256 word pieces)": None,
+        "Chunk and mean-pool": "mean",
+        "Chunk and max-pool": "max",
+    }
+    selected_mode = st.radio(
+        "Long resume handling",
+        list(long_resume_modes),
+        index=list(long_resume_modes.values()).index(st.session_state.chunk_pooling),
+        help="Chunking embeds the whole resume as overlapping windows and pools them into one vector. "
+        "Changing this re-embeds uploaded resumes in the background.",
+    )
+    if long_resume_modes[selected_mode] != st.session_state.chunk_pooling:
+        st.session_state.chunk_pooling = long_resume_modes[selected_mode]
+        st.rerun()
+
+    st.markdown("---")
+    st.subheader("Session Memory")
+    store = st.session_state.resume_store
+    precision_options = ["float32", "float16"]
+    precision = st.radio(
+        "Embedding storage precision",
+        precision_options,
+        index=precision_options.index(np.dtype(store.dtype).name),
+        horizontal=True,
+        help="float16 halves embedding memory with a negligible effect on similarity scores.",
+    )
+    if precision != np.dtype(store.dtype).name:
+        store.set_dtype(precision)
+    report = store.memory_report()
+    st.write(
+        f"{report['resumes']} resume(s) held in **{report['total_bytes'] / 1024:.1f} KB**."
+    )
+    st.dataframe(
+        pd.DataFrame(
+            [
+                {"Component": "Metadata table", "Bytes": report["metadata_bytes"]},
+                {
+                    "Component": f"Compressed text ({report['uncompressed_text_chars']:,} chars raw)",
+                    "Bytes": report["text_blob_bytes"] + report["text_offsets_bytes"],
+                },
+            ]
+            + [
+                {"Component": f"Embeddings: {key}", "Bytes": nbytes}
+                for key, nbytes in report["embedding_bytes"].items()
+            ]
+        ),
+        use_container_width=True,
+    )
+
+    st.markdown("---")
+    st.subheader("Backend Parity Check")
+    st.write(
+        "Compare embeddings from the selected backend against the fp32 PyTorch model "
+        "to see how much quantization or export changes the vectors."
+    )
+    if st.button("Run Parity Check", disabled=st.session_state.selected_backend == "torch"):
+        sample_texts = [
+            record.processed_text
+            for _, record in zip(range(32), st.session_state.resume_store)
+        ] or [
+            "experienced python developer with machine learning and sql skills",
+            "registered nurse with five years of patient care experience",
+            "financial analyst skilled in excel, forecasting and reporting",
+        ]
+        with st.spinner("Encoding sample texts with both backends..."):
+            parity = check_backend_parity(
+                st.session_state.selected_model_name,
+                st.session_state.selected_backend,
+                sample_texts,
+            )
+        if parity is not None:
+            st.write(
+                f"Mean cosine vs fp32: **{parity['mean_cosine']:.4f}**, "
+                f"min: **{parity['min_cosine']:.4f}**, "
+                f"max drift: **{parity['max_drift']:.4f}** over {parity['num_texts']} texts."
+            )
+
     st.markdown("---")
     st.subheader("Cache Management")
     if st.button("Clear Model Cache"):
@@ -284,6 +534,13 @@ elif st.session_state.current_page == "Settings":
             "You might need to re-select the model or navigate to trigger a reload."
         )
 
+    st.write(f"Cached embeddings on disk: {len(get_embedding_cache())}")
+    if st.button("Clear Embedding Cache"):
+        get_embedding_cache().clear()
+        st.success(
+            "Embedding cache cleared. Resumes will be re-embedded on next upload."
+        )
+
     st.markdown("---")
     st.write("Other application settings can be added here in the future.")
     # Example: Enable Caching (conceptual)
@@ -299,6 +556,12 @@ if "benchmark_results" not in st.session_state:
         st.session_state.benchmark_results = pd.read_csv("benchmark_results.csv")
     except Exception:
         st.session_state.benchmark_results = None
+if "benchmark_cost_report" not in st.session_state:
+    try:
+        with open("benchmark_cost_results.json", "r") as f:
+            st.session_state.benchmark_cost_report = json.load(f)
+    except Exception:
+        st.session_state.benchmark_cost_report = None
 
 if st.session_state.current_page == "Benchmark":
     st.header("Benchmark Results")
@@ -332,3 +595,72 @@ if st.session_state.current_page == "Benchmark":
 
         st.markdown("---")
         st.dataframe(results_df, use_container_width=True)
+
+    st.markdown("---")
+    st.header("Cost Benchmark")
+    cost_report = st.session_state.benchmark_cost_report
+    if cost_report is None:
+        st.warning(
+            "No cost benchmark results found. Run `python benchmark_models.py` to measure throughput, latency and memory."
+        )
+    else:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        cost_df = pd.DataFrame(cost_report["results"])
+        env = cost_report.get("environment", {})
+        st.caption(
+            f"Generated {cost_report.get('generated_at', 'unknown')} on "
+            f"{env.get('platform', 'unknown platform')} ({env.get('cpu_count', '?')} CPUs, torch {env.get('torch', '?')})"
+        )
+
+        regressions = cost_report.get("regressions", [])
+        if not cost_report.get("baseline"):
+            st.info(
+                "This run was not compared to a baseline. Run `python benchmark_models.py --save-baseline` to store one."
+            )
+        elif regressions:
+            st.error(f"{len(regressions)} regression(s) against {cost_report['baseline']}:")
+            st.dataframe(pd.DataFrame(regressions), use_container_width=True)
+        else:
+            st.success(f"No regressions against {cost_report['baseline']}.")
+
+        st.markdown("### Throughput (docs/sec) by Model and Batch Size")
+        plt.figure(figsize=(10, 6))
+        sns.barplot(x="model", y="docs_per_sec", hue="batch_size", data=cost_df, errorbar=None)
+        plt.title("Encoding Throughput by Model and Batch Size")
+        plt.ylabel("Documents per Second")
+        plt.xlabel("Model")
+        st.pyplot(plt.gcf())
+        plt.clf()
+
+        st.markdown("### Per-Query Latency by Model and Thread Count")
+        latency_df = cost_df.melt(
+            id_vars=["model", "threads"],
+            value_vars=["latency_p50_ms", "latency_p95_ms"],
+            var_name="percentile",
+            value_name="latency_ms",
+        )
+        # One bar per percentile and thread count; batch size does not affect single-query latency
+        latency_df["series"] = (
+            latency_df["percentile"].str.extract(r"(p\d+)")[0]
+            + ", "
+            + latency_df["threads"].astype(str)
+            + " thread(s)"
+        )
+        plt.figure(figsize=(10, 6))
+        sns.barplot(x="model", y="latency_ms", hue="series", data=latency_df, errorbar=None)
+        plt.title("Single Job Description Encode Latency by Thread Count")
+        plt.ylabel("Latency (ms)")
+        plt.xlabel("Model")
+        st.pyplot(plt.gcf())
+        plt.clf()
+
+        st.markdown("### Load Time and Peak Memory by Model")
+        st.dataframe(
+            cost_df.groupby("model")[["load_time_s", "peak_rss_mb"]].max().reset_index(),
+            use_container_width=True,
+        )
+
+        st.markdown("---")
+        st.dataframe(cost_df, use_container_width=True)
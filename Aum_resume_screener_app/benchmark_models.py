@@ -1,3 +1,12 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
 import pandas as pd
 import numpy as np
 from sentence_transformers import SentenceTransformer, util
@@ -5,6 +14,11 @@ from tqdm import tqdm
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
 # Models to benchmark
 MODEL_NAMES = [
     "all-MiniLM-L6-v2",
@@ -16,73 +30,312 @@ MODEL_NAMES = [
 RESUME_CSV = "datasets/merged.csv"
 JOB_DESC_CSV = "datasets/job_descriptions.csv"
 
-# Load data
-resumes = pd.read_csv(RESUME_CSV)
-jobs = pd.read_csv(JOB_DESC_CSV)
+# Quality benchmark output
+QUALITY_RESULTS_CSV = "benchmark_results.csv"
+
+# Cost benchmark configuration and output
+BATCH_SIZES = [8, 32, 128]
+THREAD_COUNTS = sorted({1, os.cpu_count() or 1})
+COST_RESULTS_JSON = "benchmark_cost_results.json"
+BASELINE_JSON = "benchmark_baseline.json"
+SCHEMA_VERSION = 1
+REGRESSION_TOLERANCE = 0.10  # Relative change that counts as a regression
+
+# For each metric: whether a higher value is better
+COST_METRICS = {
+    "docs_per_sec": True,
+    "latency_p50_ms": False,
+    "latency_p95_ms": False,
+    "load_time_s": False,
+    "peak_rss_mb": False,
+}
+
+
+def load_data(max_resumes=None, max_jobs=10):
+    """Loads resume and job description texts used by both benchmarks."""
+    resumes = pd.read_csv(RESUME_CSV)
+    jobs = pd.read_csv(JOB_DESC_CSV)
+
+    # For demonstration, we'll use the 'Top Skills' column as the resume text
+    resume_texts = resumes["Top Skills"].astype(str).tolist()
+    if max_resumes:
+        resume_texts = resume_texts[:max_resumes]
+    # Use the first N job descriptions for benchmarking
+    job_texts = jobs["Job Description"].astype(str).tolist()[:max_jobs]
+    return resume_texts, job_texts
+
+
+# --- Quality Benchmark ---
+def run_quality_benchmark(resume_texts, job_texts):
+    """Records the top-1 resume similarity per job description for each model."""
+    results = []
+
+    for model_name in MODEL_NAMES:
+        print(f"Loading model: {model_name}")
+        model = SentenceTransformer(model_name)
+        print("Encoding resumes...")
+        resume_emb = model.encode(
+            resume_texts, convert_to_tensor=True, show_progress_bar=True
+        )
+        print("Encoding job descriptions...")
+        job_emb = model.encode(job_texts, convert_to_tensor=True, show_progress_bar=True)
+
+        print(f"Calculating similarities for {model_name}...")
+        # For each job description, find the most similar resume
+        for i, job_vec in enumerate(job_emb):
+            scores = util.cos_sim(job_vec, resume_emb)[0].cpu().numpy()
+            top_idx = np.argmax(scores)
+            results.append(
+                {
+                    "model": model_name,
+                    "job_idx": i,
+                    "job_desc": job_texts[i][:100],
+                    "top_resume_idx": top_idx,
+                    "top_resume_score": scores[top_idx],
+                    "top_resume_text": resume_texts[top_idx][:100],
+                }
+            )
+
+    # Save results
+    results_df = pd.DataFrame(results)
+    results_df.to_csv(QUALITY_RESULTS_CSV, index=False)
+    print(f"Benchmarking complete. Results saved to {QUALITY_RESULTS_CSV}.")
+    return results_df
 
-# For demonstration, we'll use the 'Top Skills' column as the resume text
-resume_texts = resumes["Top Skills"].astype(str).tolist()
-# Use the first N job descriptions for benchmarking
-job_texts = jobs["Job Description"].astype(str).tolist()[:10]
 
-results = []
+def plot_quality_results(results_df):
+    # Boxplot of top similarity scores for each model
+    plt.figure(figsize=(10, 6))
+    sns.boxplot(x="model", y="top_resume_score", data=results_df)
+    plt.title("Distribution of Top Resume Similarity Scores by Model")
+    plt.ylabel("Top Resume Similarity Score")
+    plt.xlabel("Model")
+    plt.tight_layout()
+    plt.savefig("benchmark_boxplot.png")
+    plt.show()
 
-for model_name in MODEL_NAMES:
-    print(f"Loading model: {model_name}")
-    model = SentenceTransformer(model_name)
-    print("Encoding resumes...")
-    resume_emb = model.encode(
-        resume_texts, convert_to_tensor=True, show_progress_bar=True
+    # Barplot: Average top similarity score per model
+    plt.figure(figsize=(8, 5))
+    avg_scores = results_df.groupby("model")["top_resume_score"].mean().reset_index()
+    sns.barplot(x="model", y="top_resume_score", data=avg_scores)
+    plt.title("Average Top Resume Similarity Score by Model")
+    plt.ylabel("Average Top Similarity Score")
+    plt.xlabel("Model")
+    plt.tight_layout()
+    plt.savefig("benchmark_avg_barplot.png")
+    plt.show()
+
+    print(
+        "Visualization complete. Plots saved as benchmark_boxplot.png and benchmark_avg_barplot.png."
     )
-    print("Encoding job descriptions...")
-    job_emb = model.encode(job_texts, convert_to_tensor=True, show_progress_bar=True)
-
-    print(f"Calculating similarities for {model_name}...")
-    # For each job description, find the most similar resume
-    for i, job_vec in enumerate(job_emb):
-        scores = util.cos_sim(job_vec, resume_emb)[0].cpu().numpy()
-        top_idx = np.argmax(scores)
-        results.append(
-            {
-                "model": model_name,
-                "job_idx": i,
-                "job_desc": job_texts[i][:100],
-                "top_resume_idx": top_idx,
-                "top_resume_score": scores[top_idx],
-                "top_resume_text": resume_texts[top_idx][:100],
-            }
+
+
+# --- Cost Benchmark ---
+def _peak_rss_mb():
+    """Peak resident set size of the current process in MB, if measurable."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    try:
+        import psutil
+
+        memory = psutil.Process().memory_info()
+        return getattr(memory, "peak_wset", memory.rss) / (1024 * 1024)
+    except ImportError:
+        return None
+
+
+def _measure_configuration(model_name, resume_texts, job_texts, batch_size, threads):
+    # Runs in a fresh child process so load time and peak RSS belong to this configuration alone.
+    import torch
+
+    torch.set_num_threads(threads)
+    start = time.perf_counter()
+    model = SentenceTransformer(model_name, device="cpu")
+    load_time = time.perf_counter() - start
+
+    model.encode(resume_texts[:8], show_progress_bar=False)  # Warm-up
+
+    start = time.perf_counter()
+    model.encode(resume_texts, batch_size=batch_size, show_progress_bar=False)
+    elapsed = time.perf_counter() - start
+
+    # Per-query latency: one job description encoded on its own, as on the Dashboard
+    latencies = []
+    for job_text in job_texts:
+        start = time.perf_counter()
+        model.encode([job_text], show_progress_bar=False)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "model": model_name,
+        "batch_size": batch_size,
+        "threads": threads,
+        "num_docs": len(resume_texts),
+        "docs_per_sec": len(resume_texts) / elapsed,
+        "latency_p50_ms": float(np.percentile(latencies, 50)),
+        "latency_p95_ms": float(np.percentile(latencies, 95)),
+        "load_time_s": load_time,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run_cost_benchmark(resume_texts, job_texts, batch_sizes, thread_counts):
+    """Measures throughput, latency, load time and peak RSS for every configuration."""
+    context = multiprocessing.get_context("spawn")
+    configurations = [
+        (model_name, batch_size, threads)
+        for model_name in MODEL_NAMES
+        for threads in thread_counts
+        for batch_size in batch_sizes
+    ]
+    results = []
+    for model_name, batch_size, threads in tqdm(configurations, desc="Cost benchmark"):
+        # One process per configuration: peak RSS never goes down within a process
+        with context.Pool(1) as pool:
+            results.append(
+                pool.apply(
+                    _measure_configuration,
+                    (model_name, resume_texts, job_texts, batch_size, threads),
+                )
+            )
+    return results
+
+
+def _environment():
+    import torch
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "torch": torch.__version__,
+    }
+
+
+def _result_key(row):
+    return row["model"], row["batch_size"], row["threads"]
+
+
+def compare_to_baseline(results, baseline_results, tolerance=REGRESSION_TOLERANCE):
+    """Lists every metric that moved the wrong way by more than ``tolerance``."""
+    baseline_by_key = {_result_key(row): row for row in baseline_results}
+    regressions = []
+    for row in results:
+        base = baseline_by_key.get(_result_key(row))
+        if base is None:
+            continue
+        for metric, higher_is_better in COST_METRICS.items():
+            current, previous = row.get(metric), base.get(metric)
+            if not current or not previous:
+                continue
+            change = (current - previous) / previous
+            if (higher_is_better and change < -tolerance) or (
+                not higher_is_better and change > tolerance
+            ):
+                regressions.append(
+                    {
+                        "model": row["model"],
+                        "batch_size": row["batch_size"],
+                        "threads": row["threads"],
+                        "metric": metric,
+                        "baseline": previous,
+                        "current": current,
+                        "change_pct": change * 100,
+                    }
+                )
+    return regressions
+
+
+def save_cost_results(results, regressions, baseline_path=None, path=COST_RESULTS_JSON):
+    """Writes the cost report; ``baseline_path`` is None when no baseline was compared."""
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "environment": _environment(),
+        "baseline": baseline_path,
+        "results": results,
+        "regressions": regressions,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def load_cost_results(path):
+    """Reads a cost report, rejecting files written with another schema version."""
+    with open(path, "r") as f:
+        report = json.load(f)
+    if report.get("schema_version") != SCHEMA_VERSION:
+        raise ValueError(
+            f"{path} has schema version {report.get('schema_version')}, expected {SCHEMA_VERSION}"
         )
+    return report
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark ResuStreamPro embedding models.")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=BATCH_SIZES)
+    parser.add_argument("--threads", type=int, nargs="+", default=THREAD_COUNTS)
+    parser.add_argument(
+        "--max-resumes",
+        type=int,
+        default=None,
+        help="Use only the first N resumes (default: all).",
+    )
+    parser.add_argument("--skip-quality", action="store_true", help="Skip the similarity score benchmark.")
+    parser.add_argument("--skip-cost", action="store_true", help="Skip the throughput/latency/memory benchmark.")
+    parser.add_argument("--baseline", default=BASELINE_JSON, help="Baseline report to compare against.")
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Also store this run's cost report as the new baseline.",
+    )
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    resume_texts, job_texts = load_data(max_resumes=args.max_resumes)
+
+    if not args.skip_quality:
+        plot_quality_results(run_quality_benchmark(resume_texts, job_texts))
+
+    if args.skip_cost:
+        return 0
+
+    results = run_cost_benchmark(resume_texts, job_texts, args.batch_sizes, args.threads)
+
+    regressions = []
+    baseline_path = None
+    if os.path.exists(args.baseline):
+        baseline_path = args.baseline
+        baseline = load_cost_results(args.baseline)
+        regressions = compare_to_baseline(results, baseline["results"], args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}:")
+            for r in regressions:
+                print(
+                    f"  {r['model']} batch={r['batch_size']} threads={r['threads']} "
+                    f"{r['metric']}: {r['baseline']:.2f} -> {r['current']:.2f} ({r['change_pct']:+.1f}%)"
+                )
+        else:
+            print(f"No regressions against {args.baseline}.")
+    else:
+        print(f"No baseline found at {args.baseline}; run with --save-baseline to create one.")
+
+    report = save_cost_results(results, regressions, baseline_path)
+    print(f"Cost benchmark complete. Results saved to {COST_RESULTS_JSON}.")
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline updated at {args.baseline}.")
+
+    return 1 if regressions else 0
+
 
-# Save results
-results_df = pd.DataFrame(results)
-results_df.to_csv("benchmark_results.csv", index=False)
-print("Benchmarking complete. Results saved to benchmark_results.csv.")
-
-# --- Visualization ---
-# Load results (in case running separately)
-results_df = pd.read_csv("benchmark_results.csv")
-
-# Boxplot of top similarity scores for each model
-plt.figure(figsize=(10, 6))
-sns.boxplot(x="model", y="top_resume_score", data=results_df)
-plt.title("Distribution of Top Resume Similarity Scores by Model")
-plt.ylabel("Top Resume Similarity Score")
-plt.xlabel("Model")
-plt.tight_layout()
-plt.savefig("benchmark_boxplot.png")
-plt.show()
-
-# Barplot: Average top similarity score per model
-plt.figure(figsize=(8, 5))
-avg_scores = results_df.groupby("model")["top_resume_score"].mean().reset_index()
-sns.barplot(x="model", y="top_resume_score", data=avg_scores)
-plt.title("Average Top Resume Similarity Score by Model")
-plt.ylabel("Average Top Similarity Score")
-plt.xlabel("Model")
-plt.tight_layout()
-plt.savefig("benchmark_avg_barplot.png")
-plt.show()
-
-print(
-    "Visualization complete. Plots saved as benchmark_boxplot.png and benchmark_avg_barplot.png."
-)
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "embeddings.sqlite3")
+DEFAULT_MAX_ENTRIES = 50_000
+
+
+def text_hash(text):
+    """Returns the SHA-256 hex digest of a text string."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """On-disk float32 embedding store keyed by (model name, text hash).
+
+    Backed by SQLite so several Streamlit processes can share one cache file.
+    Entries are evicted least-recently-used once ``max_entries`` is exceeded.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    dim INTEGER NOT NULL,
+                    vector BLOB NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (model, text_hash)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embeddings_last_access "
+                "ON embeddings (last_access)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        # A fresh connection per call keeps the cache usable from any thread;
+        # the busy timeout makes concurrent writers wait instead of failing.
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_many(self, model_name, hashes):
+        """Returns a {hash: float32 vector} dict for the hashes found in the cache."""
+        found = {}
+        if not hashes:
+            return found
+        unique_hashes = list(dict.fromkeys(hashes))
+        now = time.time()
+        with self._connect() as conn:
+            # Stay well under SQLite's bound-parameter limit.
+            for start in range(0, len(unique_hashes), 500):
+                chunk = unique_hashes[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT text_hash, dim, vector FROM embeddings "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model_name, *chunk],
+                ).fetchall()
+                for h, dim, blob in rows:
+                    found[h] = np.frombuffer(blob, dtype=np.float32, count=dim)
+            if found:
+                conn.executemany(
+                    "UPDATE embeddings SET last_access = ? WHERE model = ? AND text_hash = ?",
+                    [(now, model_name, h) for h in found],
+                )
+        return found
+
+    def put_many(self, model_name, hashes, vectors):
+        """Stores one vector per hash, then evicts the oldest entries over the cap."""
+        now = time.time()
+        rows = []
+        for h, vector in zip(hashes, vectors):
+            vector = np.ascontiguousarray(vector, dtype=np.float32).ravel()
+            rows.append((model_name, h, vector.size, vector.tobytes(), now))
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, dim, vector, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._evict(conn)
+
+    def _evict(self, conn):
+        (count,) = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM embeddings WHERE rowid IN ("
+                "SELECT rowid FROM embeddings ORDER BY last_access ASC LIMIT ?)",
+                (overflow,),
+            )
+
+    def clear(self):
+        """Removes every cached embedding."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM embeddings")
+
+    def __len__(self):
+        with self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return count
@@ -0,0 +1,116 @@
+"""Parallel resume text extraction.
+
+Kept free of Streamlit and model imports so that pool workers start quickly.
+"""
+
+import io
+import multiprocessing
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from PyPDF2 import PdfReader
+from docx import Document
+
+DEFAULT_TIMEOUT_SECONDS = 60
+POLL_INTERVAL_SECONDS = 0.25
+
+ExtractionResult = namedtuple("ExtractionResult", ["index", "filename", "text", "error"])
+
+
+def default_worker_count():
+    """Leaves one core for the Streamlit server itself."""
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def extract_text_from_bytes(filename, data):
+    """Extracts text from a PDF, DOCX or TXT file's bytes. Raises on failure."""
+    name = filename.lower()
+    if name.endswith(".pdf"):
+        reader = PdfReader(io.BytesIO(data))
+        pages = (page.extract_text() for page in reader.pages)
+        return "".join(page_text + "\n" for page_text in pages if page_text)
+    elif name.endswith(".docx"):
+        doc = Document(io.BytesIO(data))
+        return "".join(para.text + "\n" for para in doc.paragraphs)
+    elif name.endswith(".txt"):
+        return data.decode("utf-8")
+    raise ValueError(
+        f"Unsupported file format: {filename}. Only PDF, DOCX, TXT are supported."
+    )
+
+
+def _error_message(error):
+    return str(error) or error.__class__.__name__
+
+
+def _terminate_workers(executor):
+    # A hung PyPDF2 call cannot be cancelled, so its worker has to be killed.
+    for process in list(getattr(executor, "_processes", {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def extract_texts_parallel(files, max_workers=None, timeout=DEFAULT_TIMEOUT_SECONDS):
+    """Extracts text from (filename, bytes) pairs on a process pool.
+
+    Yields an ExtractionResult per file as soon as it finishes, in completion
+    order. A file that raises yields its error message; a file still running
+    after ``timeout`` seconds yields a timeout error, and the pool is restarted
+    so the remaining files are not held up by the stuck worker. Every file,
+    even a single one, runs in a worker process so the timeout always applies.
+    """
+    max_workers = max_workers or default_worker_count()
+    queue = list(enumerate(files))
+    queue.reverse()  # Popped from the end, so files go out in upload order
+
+    while queue:
+        # Spawned (not forked) workers: the Streamlit server is multi-threaded.
+        executor = ProcessPoolExecutor(
+            max_workers=min(max_workers, len(queue)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        futures = {}
+        deadlines = {}
+        restart = False
+        try:
+            while (queue or futures) and not restart:
+                # No more files in flight than workers, so a submitted file starts
+                # at once and its deadline can count from submission (worker
+                # start-up included) without ever timing out a queued file.
+                while queue and len(futures) < max_workers:
+                    index, (filename, data) = queue.pop()
+                    future = executor.submit(extract_text_from_bytes, filename, data)
+                    futures[future] = (index, filename, data)
+                    deadlines[future] = time.monotonic() + timeout
+
+                done, _ = wait(
+                    futures, timeout=POLL_INTERVAL_SECONDS, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    index, filename, _ = futures.pop(future)
+                    try:
+                        yield ExtractionResult(index, filename, future.result(), None)
+                    except Exception as e:
+                        yield ExtractionResult(index, filename, "", _error_message(e))
+
+                now = time.monotonic()
+                for future in list(futures):
+                    if now > deadlines[future]:
+                        index, filename, _ = futures.pop(future)
+                        yield ExtractionResult(
+                            index, filename, "", f"Timed out after {timeout:.0f}s"
+                        )
+                        restart = True
+        finally:
+            if restart or futures:
+                _terminate_workers(executor)
+            else:
+                executor.shutdown()
+
+        # Files that had not finished when the pool was killed go to a fresh pool.
+        queue.extend(sorted(
+            ((index, (filename, data)) for index, filename, data in futures.values()),
+            reverse=True,
+        ))
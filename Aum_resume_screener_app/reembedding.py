@@ -0,0 +1,75 @@
+import threading
+
+import numpy as np
+
+from utils import DEFAULT_BATCH_SIZE, encode_texts, normalize_embeddings
+
+
+class ReembeddingJob:
+    """Embeds resume texts with one model on a daemon thread.
+
+    The job never touches ``st.session_state``; the script thread polls
+    ``progress`` and merges ``result`` once ``is_running()`` turns false.
+    ``start_row`` and ``generation`` let the caller check that the result
+    still lines up with the session's resume list before appending it.
+    """
+
+    def __init__(
+        self,
+        model_name,
+        model,
+        texts,
+        start_row,
+        generation,
+        cache=None,
+        batch_size=DEFAULT_BATCH_SIZE,
+        pooling=None,
+    ):
+        self.model_name = model_name
+        self.model = model
+        self.texts = list(texts)
+        self.start_row = start_row
+        self.generation = generation
+        self.cache = cache
+        self.batch_size = batch_size
+        self.pooling = pooling
+        self.completed = 0
+        self.result = None
+        self.error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def total(self):
+        return len(self.texts)
+
+    @property
+    def progress(self):
+        return self.completed / self.total if self.total else 1.0
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def is_running(self):
+        return self._thread.is_alive()
+
+    def _run(self):
+        # Encode a few batches per step so progress moves while the
+        # length-sorted batching still has enough texts to group.
+        step = self.batch_size * 4
+        chunks = []
+        try:
+            for start in range(0, self.total, step):
+                embeddings = encode_texts(
+                    self.texts[start : start + step],
+                    self.model,
+                    self.batch_size,
+                    self.model_name,
+                    self.cache,
+                    self.pooling,
+                )
+                chunks.append(normalize_embeddings(embeddings))
+                self.completed = min(start + step, self.total)
+            self.result = np.concatenate(chunks)
+        except Exception as e:
+            self.error = e
@@ -0,0 +1,146 @@
+import sys
+import zlib
+from array import array
+from collections import namedtuple
+
+import numpy as np
+
+from utils import normalize_embeddings, preprocess_text
+
+ResumeRecord = namedtuple(
+    "ResumeRecord", ["index", "filename", "content_hash", "raw_text", "processed_text"]
+)
+
+EMBEDDING_DTYPES = {"float32": np.float32, "float16": np.float16}
+
+
+class ResumeStore:
+    """Compact columnar store for one session's uploaded resumes.
+
+    Instead of a dict per resume, the store keeps:
+    - a slim metadata table (filename and content hash columns),
+    - every raw text zlib-compressed into one byte blob, addressed by offsets,
+    - one embedding matrix per model key, in float32 or float16, whose
+      row i belongs to resume i.
+
+    Processed text is not stored at all; it is rebuilt from the raw text on
+    demand with ``preprocess_text``.
+    """
+
+    def __init__(self, dtype="float32"):
+        self.dtype = EMBEDDING_DTYPES[dtype]
+        self.clear()
+
+    def clear(self):
+        """Removes every resume and embedding."""
+        self._filenames = []
+        self._hashes = []
+        self._hash_set = set()
+        self._text_blob = bytearray()
+        self._text_offsets = array("Q", [0])
+        self._raw_chars = 0
+        # Model key -> (row buffer with spare capacity, number of rows used)
+        self._embeddings = {}
+
+    def __len__(self):
+        return len(self._filenames)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.record(index)
+
+    # --- Resumes ---
+    def add(self, filename, content_hash, raw_text):
+        """Appends a resume and returns its row index."""
+        self._filenames.append(filename)
+        self._hashes.append(content_hash)
+        self._hash_set.add(content_hash)
+        self._text_blob += zlib.compress(raw_text.encode("utf-8"))
+        self._text_offsets.append(len(self._text_blob))
+        self._raw_chars += len(raw_text)
+        return len(self) - 1
+
+    def has_hash(self, content_hash):
+        return content_hash in self._hash_set
+
+    @property
+    def filenames(self):
+        return list(self._filenames)
+
+    def filename(self, index):
+        return self._filenames[index]
+
+    def raw_text(self, index):
+        start, end = self._text_offsets[index], self._text_offsets[index + 1]
+        return zlib.decompress(self._text_blob[start:end]).decode("utf-8")
+
+    def processed_text(self, index):
+        return preprocess_text(self.raw_text(index))
+
+    def record(self, index):
+        raw_text = self.raw_text(index)
+        return ResumeRecord(
+            index,
+            self._filenames[index],
+            self._hashes[index],
+            raw_text,
+            preprocess_text(raw_text),
+        )
+
+    # --- Embeddings ---
+    def embedded_count(self, model_key):
+        """Number of leading resumes that have embeddings for the model key."""
+        _, count = self._embeddings.get(model_key, (None, 0))
+        return count
+
+    def embeddings(self, model_key):
+        """Returns the normalized embedding matrix for the model key, or None."""
+        if model_key not in self._embeddings:
+            return None
+        buffer, count = self._embeddings[model_key]
+        return buffer[:count]
+
+    def append_embeddings(self, model_key, embeddings):
+        """Normalizes embeddings and appends them as the next rows for the model key."""
+        rows = normalize_embeddings(embeddings).astype(self.dtype)
+        buffer, count = self._embeddings.get(model_key, (None, 0))
+        needed = count + len(rows)
+        if buffer is None or needed > len(buffer):
+            # Grow geometrically so repeated uploads stay amortized O(1) per row.
+            capacity = max(needed, 2 * (0 if buffer is None else len(buffer)), 64)
+            grown = np.empty((capacity, rows.shape[1]), dtype=self.dtype)
+            if buffer is not None:
+                grown[:count] = buffer[:count]
+            buffer = grown
+        buffer[count:needed] = rows
+        self._embeddings[model_key] = (buffer, needed)
+
+    def set_dtype(self, dtype):
+        """Converts every stored embedding matrix to float32 or float16."""
+        self.dtype = EMBEDDING_DTYPES[dtype]
+        self._embeddings = {
+            key: (buffer[:count].astype(self.dtype), count)
+            for key, (buffer, count) in self._embeddings.items()
+        }
+
+    # --- Memory Report ---
+    def memory_report(self):
+        """Returns approximate bytes held by each part of the store."""
+        metadata_bytes = sum(sys.getsizeof(name) for name in self._filenames) + sum(
+            sys.getsizeof(h) for h in self._hashes
+        )
+        embedding_bytes = {
+            key: buffer.nbytes for key, (buffer, _) in self._embeddings.items()
+        }
+        return {
+            "resumes": len(self),
+            "metadata_bytes": metadata_bytes,
+            "text_blob_bytes": len(self._text_blob),
+            "text_offsets_bytes": self._text_offsets.itemsize * len(self._text_offsets),
+            "uncompressed_text_chars": self._raw_chars,
+            "embedding_bytes": embedding_bytes,
+            "total_bytes": metadata_bytes
+            + len(self._text_blob)
+            + self._text_offsets.itemsize * len(self._text_offsets)
+            + sum(embedding_bytes.values()),
+        }
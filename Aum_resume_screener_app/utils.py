@@ -1,25 +1,115 @@
+import hashlib
 import os
+import platform
 import re
+import shutil
+import tempfile
 import torch
 from sentence_transformers import SentenceTransformer, util
 from PyPDF2 import PdfReader
 from docx import Document
 import streamlit as st
 import numpy as np
+from embedding_cache import EmbeddingCache, text_hash
 
 
 # --- Model Loading (Cached) ---
+# "torch" is the plain fp32 PyTorch model; the ONNX backends need
+# `pip install sentence-transformers[onnx]` and suit CPU-only hosts.
+BACKENDS = ["torch", "onnx", "onnx-int8"]
+MODEL_ARTIFACTS_DIR = os.path.join(".cache", "models")
+
+
+def embedding_model_key(model_name, backend="torch", pooling=None):
+    """Identifies the vectors a model/backend/pooling combination produces, for caches and stores."""
+    key = model_name if backend == "torch" else f"{model_name}@{backend}"
+    return key if pooling is None else f"{key}#chunks-{pooling}"
+
+
+def _quantization_config():
+    # Dynamic int8 quantization kernels differ per instruction set.
+    machine = platform.machine().lower()
+    return "arm64" if machine in ("arm64", "aarch64") else "avx2"
+
+
+def _build_model(model_name, backend):
+    if backend == "torch":
+        return SentenceTransformer(model_name)
+
+    # Export the ONNX graph once and reuse it from disk on later loads. Exports are
+    # written to a temporary directory and moved into place, so an interrupted
+    # export is never mistaken for a finished one.
+    export_dir = os.path.join(MODEL_ARTIFACTS_DIR, f"{model_name}-onnx")
+    if not os.path.isdir(export_dir):
+        os.makedirs(MODEL_ARTIFACTS_DIR, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=MODEL_ARTIFACTS_DIR)
+        try:
+            SentenceTransformer(model_name, backend="onnx").save_pretrained(tmp_dir)
+            os.rename(tmp_dir, export_dir)
+        except OSError:
+            # Another process finished the same export first
+            if not os.path.isdir(export_dir):
+                raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    if backend == "onnx":
+        return SentenceTransformer(export_dir, backend="onnx")
+
+    # Only in sentence-transformers versions with ONNX export support
+    from sentence_transformers import export_dynamic_quantized_onnx_model
+
+    config = _quantization_config()
+    quantized_file = os.path.join("onnx", f"model_qint8_{config}.onnx")
+    if not os.path.exists(os.path.join(export_dir, quantized_file)):
+        tmp_dir = tempfile.mkdtemp(dir=MODEL_ARTIFACTS_DIR)
+        try:
+            export_dynamic_quantized_onnx_model(
+                SentenceTransformer(export_dir, backend="onnx"), config, tmp_dir
+            )
+            os.replace(os.path.join(tmp_dir, quantized_file), os.path.join(export_dir, quantized_file))
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    return SentenceTransformer(
+        export_dir, backend="onnx", model_kwargs={"file_name": quantized_file}
+    )
+
+
 @st.cache_resource  # Caches the model across reruns and sessions for efficiency
-def load_model(model_name="all-MiniLM-L6-v2"):
-    """Loads the Sentence Transformer model."""
+def load_model(model_name="all-MiniLM-L6-v2", backend="torch"):
+    """Loads the Sentence Transformer model with the given inference backend."""
+    if backend not in BACKENDS:
+        st.error(f"Unknown backend {backend}. Choose one of: {', '.join(BACKENDS)}.")
+        return None
     try:
-        model = SentenceTransformer(model_name)
+        model = _build_model(model_name, backend)
         return model
     except Exception as e:
-        st.error(f"Error loading model {model_name}: {e}")
+        st.error(f"Error loading model {model_name} ({backend}): {e}")
         return None
 
 
+def check_backend_parity(model_name, backend, texts):
+    """Compares a backend's embeddings with the fp32 PyTorch model on sample texts.
+
+    Returns the mean and minimum cosine similarity between matching vectors,
+    and the largest drift (1 - cosine) seen.
+    """
+    reference_model = load_model(model_name, "torch")
+    candidate_model = load_model(model_name, backend)
+    if reference_model is None or candidate_model is None:
+        return None
+
+    reference = normalize_embeddings(reference_model.encode(texts, show_progress_bar=False))
+    candidate = normalize_embeddings(candidate_model.encode(texts, show_progress_bar=False))
+    cosines = np.sum(reference * candidate, axis=1)
+    return {
+        "num_texts": len(texts),
+        "mean_cosine": float(cosines.mean()),
+        "min_cosine": float(cosines.min()),
+        "max_drift": float(1.0 - cosines.min()),
+    }
+
+
 # --- Text Extraction Functions ---
 def extract_text_from_pdf(uploaded_file):
     text = ""
@@ -81,8 +171,143 @@ def preprocess_text(text):
     return text.strip()
 
 
+# --- Embedding Cache ---
+@st.cache_resource  # One cache handle per process; the SQLite file is shared across processes
+def get_embedding_cache():
+    """Opens the persistent on-disk embedding cache."""
+    return EmbeddingCache()
+
+
+def content_hash(data):
+    """Returns the SHA-256 hex digest of raw file bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
 # --- Embedding Generation Function ---
-def get_embeddings(texts, model):
+DEFAULT_BATCH_SIZE = 32
+
+
+def _encode_length_sorted(texts, model, batch_size):
+    # Sorting by length keeps similarly sized texts together, so each batch
+    # pads to a short maximum instead of the longest resume in the upload.
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+
+    batches = []
+    for start in range(0, len(order), batch_size):
+        batch_texts = [texts[i] for i in order[start : start + batch_size]]
+        batches.append(
+            model.encode(
+                batch_texts,
+                batch_size=len(batch_texts),
+                convert_to_tensor=True,
+                show_progress_bar=False,
+            )
+        )
+    sorted_embeddings = torch.cat(batches)
+
+    # Scatter the rows back to the order the texts were passed in.
+    embeddings = torch.empty_like(sorted_embeddings)
+    embeddings[torch.tensor(order, device=sorted_embeddings.device)] = sorted_embeddings
+    return embeddings
+
+
+# --- Chunked Encoding ---
+# Long resumes are split into overlapping windows that fit the model, and the
+# window vectors are pooled back into one vector per document.
+POOLING_MODES = ["mean", "max"]
+CHUNK_OVERLAP_TOKENS = 32
+
+
+def chunk_texts(texts, tokenizer, window, overlap=CHUNK_OVERLAP_TOKENS):
+    """Splits texts into overlapping windows of at most ``window`` word pieces.
+
+    Returns the window strings and, for each window, the index of its text.
+    """
+    encoded = tokenizer(
+        texts, add_special_tokens=False, return_offsets_mapping=True, truncation=False
+    )
+    stride = window - overlap
+    chunks, owners = [], []
+    for doc_index, (text, offsets) in enumerate(zip(texts, encoded["offset_mapping"])):
+        if not offsets:
+            chunks.append(text)
+            owners.append(doc_index)
+            continue
+        # Stop once the remaining tokens are already covered by the overlap.
+        for start in range(0, max(len(offsets) - overlap, 1), stride):
+            window_offsets = offsets[start : start + window]
+            chunks.append(text[window_offsets[0][0] : window_offsets[-1][1]])
+            owners.append(doc_index)
+    return chunks, np.array(owners, dtype=np.int64)
+
+
+def pool_chunk_embeddings(chunk_embeddings, owners, num_docs, pooling="mean"):
+    """Pools normalized window vectors into one vector per document."""
+    dim = chunk_embeddings.shape[1]
+    if pooling == "max":
+        pooled = np.full((num_docs, dim), -np.inf, dtype=np.float32)
+        np.maximum.at(pooled, owners, chunk_embeddings)
+        return pooled
+    pooled = np.zeros((num_docs, dim), dtype=np.float32)
+    np.add.at(pooled, owners, chunk_embeddings)
+    return pooled / np.bincount(owners, minlength=num_docs)[:, None]
+
+
+def _encode_chunked(texts, model, batch_size, pooling):
+    window = model.max_seq_length - 2  # Room for [CLS] and [SEP]
+    chunks, owners = chunk_texts(
+        texts, model.tokenizer, window, min(CHUNK_OVERLAP_TOKENS, window // 4)
+    )
+    # Windows from every document share one length-sorted pass, so cost
+    # follows the total number of tokens rather than the number of resumes.
+    chunk_embeddings = normalize_embeddings(
+        _encode_length_sorted(chunks, model, batch_size)
+    )
+    return torch.from_numpy(
+        pool_chunk_embeddings(chunk_embeddings, owners, len(texts), pooling)
+    )
+
+
+def encode_texts(
+    texts, model, batch_size=DEFAULT_BATCH_SIZE, model_name=None, cache=None, pooling=None
+):
+    """Encodes texts through the embedding cache without touching the Streamlit UI.
+
+    With ``pooling`` set to one of POOLING_MODES, each text is chunked and its
+    window vectors pooled. Safe to call from background threads; errors are
+    raised to the caller.
+    """
+    def encode(batch):
+        if pooling is None:
+            return _encode_length_sorted(batch, model, batch_size)
+        return _encode_chunked(batch, model, batch_size, pooling)
+
+    if model_name is None or cache is None:
+        return encode(texts)
+
+    hashes = [text_hash(t) for t in texts]
+    vectors = cache.get_many(model_name, hashes)
+
+    missing = list(dict.fromkeys(h for h in hashes if h not in vectors))
+    if missing:
+        text_by_hash = dict(zip(hashes, texts))
+        new_embeddings = encode([text_by_hash[h] for h in missing])
+        new_vectors = new_embeddings.cpu().numpy().astype(np.float32)
+        cache.put_many(model_name, missing, new_vectors)
+        vectors.update(zip(missing, new_vectors))
+
+    return torch.from_numpy(np.stack([vectors[h] for h in hashes]))
+
+
+def get_embeddings(
+    texts, model, batch_size=DEFAULT_BATCH_SIZE, model_name=None, pooling=None
+):
+    """Encodes texts in length-sorted batches and returns them in input order.
+
+    When ``model_name`` is given, vectors are read from and written to the
+    persistent embedding cache so previously seen texts skip the model.
+    ``pooling`` enables chunked encoding of long texts (see encode_texts).
+    """
     if model is None:
         st.error("Embedding model is not loaded.")
         return None
@@ -91,15 +316,64 @@ def get_embeddings(texts, model):
 
     # Ensure all items in texts are strings
     processed_texts = [str(t) if t is not None else "" for t in texts]
+    if not processed_texts:
+        return None
 
     try:
-        embeddings = model.encode(processed_texts, convert_to_tensor=True)
-        return embeddings
+        cache = get_embedding_cache() if model_name is not None else None
+        return encode_texts(
+            processed_texts, model, batch_size, model_name, cache, pooling
+        )
     except Exception as e:
         st.error(f"Error generating embeddings: {e}")
         return None
 
 
+# --- Matrix Matching Functions ---
+def normalize_embeddings(embeddings):
+    """Returns the embeddings as a contiguous float32 matrix of unit-length rows."""
+    if isinstance(embeddings, torch.Tensor):
+        embeddings = embeddings.detach().cpu().numpy()
+    matrix = np.ascontiguousarray(np.atleast_2d(embeddings), dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0  # Leave all-zero rows as zeros instead of NaNs
+    return matrix / norms
+
+
+def append_embeddings(matrix, embeddings):
+    """Normalizes new embeddings and appends them as rows of the matrix."""
+    new_rows = normalize_embeddings(embeddings)
+    if matrix is None or len(matrix) == 0:
+        return new_rows
+    return np.concatenate([matrix, new_rows])
+
+
+def top_k_matches(matrix, query_embedding, k):
+    """Returns (row indices, cosine scores) of the k best matches, best first."""
+    if matrix is None or len(matrix) == 0 or k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    # Rows are pre-normalized, so one matrix-vector product gives cosine scores.
+    query = normalize_embeddings(query_embedding)[0]
+    if matrix.dtype == np.float32:
+        scores = matrix @ query
+    else:
+        # NumPy has no fast float16 matmul; upcast in blocks to bound the copy.
+        scores = np.concatenate(
+            [
+                matrix[start : start + 4096].astype(np.float32) @ query
+                for start in range(0, len(matrix), 4096)
+            ]
+        )
+    k = min(k, len(scores))
+    if k < len(scores):
+        top_indices = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top_indices = np.arange(len(scores))
+    top_indices = top_indices[np.argsort(-scores[top_indices], kind="stable")]
+    return top_indices, scores[top_indices]
+
+
 # --- Cosine Similarity Function ---
 def calculate_cosine_similarity(embedding1, embedding2):
     if embedding1 is None or embedding2 is None:
@@ -1,3 +1,6 @@
+import io
+import os
+
 import pdfminer.high_level
 import docx2txt
 
@@ -18,10 +21,20 @@ def extract_text_from_docx(file_path):
         print(f"Error parsing DOCX: {e}")
         return ""     
 
-def extract_resume_text(file_path):
-    if file_path.endswith(".pdf"):
-        return extract_text_from_pdf(file_path)
-    elif file_path.endswith(".docx"):
-        return extract_text_from_docx(file_path)
+def _as_stream(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if not isinstance(source, (str, os.PathLike)):
+        source.seek(0)
+    return source
+
+def extract_resume_text(source, filename=None):
+    """Accepts a file path, raw bytes or a file-like upload (parsed in memory)."""
+    if filename is None:
+        filename = os.fspath(source) if isinstance(source, (str, os.PathLike)) else getattr(source, "name", "")
+    if filename.endswith(".pdf"):
+        return extract_text_from_pdf(_as_stream(source))
+    elif filename.endswith(".docx"):
+        return extract_text_from_docx(_as_stream(source))
     else:
         raise ValueError("Unsupported file type. Use PDF or DOCX.")
\ No newline at end of file
@@ -1,5 +1,4 @@
 import streamlit as st
-import os
 
 # Internal module imports
 from app.resume_parser import extract_resume_text
@@ -21,17 +20,10 @@ uploaded_file = st.file_uploader("📄 Upload Resume (PDF or DOCX)", type=["pdf"
 
 # ---------------------------- Main Analysis Logic ----------------------------
 if uploaded_file and job_input.strip():
-    file_ext = uploaded_file.name.split(".")[-1]
-    resume_path = f"temp_resume.{file_ext}"
-
-    # Save uploaded file temporarily
-    with open(resume_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
-
     with st.spinner("🔍 Analyzing resume..."):
         try:
             # Step 1: Resume extraction & cleaning
-            resume_text = extract_resume_text(resume_path)
+            resume_text = extract_resume_text(uploaded_file.getvalue(), uploaded_file.name)
             cleaned_resume = lemmatize_text(clean_text(resume_text))
 
             # Step 2: Job description cleaning
@@ -52,9 +44,6 @@ if uploaded_file and job_input.strip():
         except Exception as e:
             st.error(f"❌ Error during analysis: {e}")
 
-    # Cleanup temp file
-    os.remove(resume_path)
-
 # ---------------------------- Input Validation States ----------------------------
 elif uploaded_file and not job_input.strip():
     st.warning("⚠️ Please enter a job description before uploading a resume.")
@@ -1,10 +1,10 @@
 import streamlit as st
 import pandas as pd
-import time
+import hashlib
 import json
 import os
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List
 from dotenv import load_dotenv
 
 # This is the only set_page_config call needed
@@ -23,8 +23,8 @@ st.set_page_config(
 load_dotenv()
 
 try:
-    from parser import extract_text, extract_info
-    from matching import compute_match
+    from matching import ResumeVocabulary
+    from pipeline import NO_TERMS_ERROR, SCORE_BATCH_SIZE, parse_files
     from utils import show_pdf
     from firebase_auth import firebase_auth
 except ImportError as e:
@@ -107,6 +107,10 @@ if 'processing' not in st.session_state:
     st.session_state.processing = False
 if 'results' not in st.session_state:
     st.session_state.results = None
+# Parsed resumes by file content hash: {"text", "info", "vectors"}
+if 'parsed_resumes' not in st.session_state:
+    st.session_state.parsed_resumes = {}
+    st.session_state.resume_vocabulary = ResumeVocabulary()
 
 # --- Utility functions ---
 
@@ -153,41 +157,94 @@ def save_job_descriptions(jd_options: Dict[str, str]):
     with open("job_descriptions.json", "w") as f:
         json.dump(jd_options, f, indent=4)
 
+def build_result_row(filename: str, text: str, info: Dict, match_score: float) -> Dict:
+    """One row of the results table."""
+    return {
+        "Candidate": filename,
+        "Match %": round(match_score, 1),
+        "Email": info.get("email", "Not found"),
+        "Phone": info.get("phone", "Not found"),
+        "Skills": ", ".join(info.get("skills", [])) if info.get("skills") else "Not found",
+        "Experience": info.get("experience", "Not specified"),
+        "Education": info.get("education", "Not specified"),
+        "Recommendation": "⭐ Strong Match" if match_score >= 85
+                          else "👍 Good Fit" if match_score >= 70
+                          else "🤔 Needs Review",
+        "Raw Text": text  # Store for preview if needed
+    }
+
 def process_resumes(uploaded_files, selected_jd_text):
-    """Process uploaded resumes and compute match scores."""
+    """
+    Score uploaded resumes against the JD, showing rows as they complete.
+
+    Resumes parsed earlier in the session are found by content hash and
+    only rescored, so editing the JD never re-reads a file.
+    """
+    cache = st.session_state.parsed_resumes
+    vocabulary = st.session_state.resume_vocabulary
+    uploads_by_hash: Dict[str, List] = {}
+    for file in uploaded_files:
+        uploads_by_hash.setdefault(hashlib.sha256(file.getvalue()).hexdigest(), []).append(file)
+    # Forget resumes no longer uploaded so the cache tracks the current batch
+    for key in [key for key in cache if key not in uploads_by_hash]:
+        del cache[key]
+    # Forgotten resumes keep their terms in the vocabulary, and scoring allocates a row
+    # over all of them; once they are the majority, re-vectorize the rest afresh
+    if vocabulary.vectorized > 2 * len(cache):
+        st.session_state.resume_vocabulary = vocabulary = ResumeVocabulary()
+        for entry in cache.values():
+            entry["vectors"] = vocabulary.vectorize(entry["text"])
+
     results = []
     progress_bar = st.progress(0)
     status_text = st.empty()
+    live_table = st.empty()
+    done = 0
 
-    for i, file in enumerate(uploaded_files):
-        status_text.markdown(f"<div class='card'>Processing <b>{i+1}/{len(uploaded_files)}</b>: {file.name}</div>",
+    def update_progress():
+        status_text.markdown(f"<div class='card'>Processed <b>{done}/{len(uploaded_files)}</b></div>",
                              unsafe_allow_html=True)
-        try:
-            text = extract_text(file)
-            info = extract_info(text)
-            match_score = compute_match(text, selected_jd_text)
-
-            results.append({
-                "Candidate": file.name,
-                "Match %": round(match_score, 1),
-                "Email": info.get("email", "Not found"),
-                "Phone": info.get("phone", "Not found"),
-                "Skills": ", ".join(info.get("skills", [])) if info.get("skills") else "Not found",
-                "Experience": info.get("experience", "Not specified"),
-                "Education": info.get("education", "Not specified"),
-                "Recommendation": "⭐ Strong Match" if match_score >= 85
-                                  else "👍 Good Fit" if match_score >= 70
-                                  else "🤔 Needs Review",
-                "Raw Text": text  # Store for preview if needed
-            })
-
-            progress_bar.progress((i + 1) / len(uploaded_files))
-            time.sleep(0.1)  # Simulate processing delay
-
-        except Exception as e:
-            st.error(f"Error processing {file.name}: {str(e)}")
+        progress_bar.progress(done / len(uploaded_files))
+
+    def show(keys):
+        nonlocal done
+        scores = vocabulary.score([cache[key]["vectors"] for key in keys], selected_jd_text)
+        for key, score in zip(keys, scores):
+            for file in uploads_by_hash[key]:
+                if score is None:
+                    st.error(f"Error processing {file.name}: {NO_TERMS_ERROR}")
+                else:
+                    results.append(build_result_row(file.name, cache[key]["text"], cache[key]["info"], score))
+                done += 1
+        if results:
+            live_table.dataframe(pd.DataFrame(results).drop(columns=["Raw Text"]))
+        update_progress()
+
+    show([key for key in uploads_by_hash if key in cache])
+
+    # Only new files are copied out of their uploads, and only when they enter the extraction pool
+    new_keys = [key for key in uploads_by_hash if key not in cache]
+    files = [(uploads_by_hash[key][0].name, uploads_by_hash[key][0].getvalue) for key in new_keys]
+    batch = []
+    for index, item in parse_files(files):
+        key = new_keys[index]
+        if item.error:
+            # Failures are not cached, so the next run tries the file again
+            for file in uploads_by_hash[key]:
+                st.error(f"Error processing {file.name}: {item.error}")
+                done += 1
+            update_progress()
+            continue
+        cache[key] = {"text": item.text, "info": item.info, "vectors": vocabulary.vectorize(item.text)}
+        batch.append(key)
+        if len(batch) >= SCORE_BATCH_SIZE:
+            show(batch)
+            batch = []
+    if batch:
+        show(batch)
 
     status_text.empty()
+    live_table.empty()
     return results
 
 # --- Authentication pages ---
@@ -0,0 +1,208 @@
+import argparse
+import os
+import random
+import re
+import time
+from typing import Any, Dict, List
+
+from parser import (
+    SKILL_SET,
+    extract_education,
+    extract_experience,
+    segment_sections,
+    extract_fields,
+    extract_info_batch,
+    extract_text_from_bytes,
+)
+
+RESUME_DIR = os.path.join("..", "venv", "data", "Resumes")
+
+
+def legacy_extract_education(text: str) -> str:
+    """extract_education before section segmentation: unbounded searches over the whole text"""
+    patterns = [
+        r"(?:education|academic background|qualifications)[\s\S]*?(?:(?:master|bachelor|ph\.?d|doctorate)[\s\S]*?(?:\d{4}[\s-]*(?:\d{4}|present)))",
+        r"(master['s]?|bachelor['s]?|ph\.?d|doctorate)[\s\S]*?(?:in|of)[\s\S]*?[a-z]+(?:[\s,]*\d{4})",
+        r"\b(university|college|institute)\b.*?\b(?:degree|diploma|certificate)\b"
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return match.group(0).strip()
+    return "Not specified"
+
+
+def legacy_extract_experience(text: str) -> str:
+    """extract_experience before section segmentation"""
+    exp_pattern = r"(?:\d+\+?[\s-]*(?:years?|yrs?)[\s-]*(?:experience))|(?:experience[\s\S]*?\d+\+?[\s-]*(?:years?|yrs?))"
+    match = re.search(exp_pattern, text, re.IGNORECASE)
+    if match:
+        return match.group(0).strip()
+    job_pattern = r"(?:experience|work history|employment)[\s\S]*?(?:(?:[a-z]+\s\d{4}[\s-]*(?:present|\d{4})))"
+    match = re.search(job_pattern, text, re.IGNORECASE)
+    if match:
+        return f"Experience mentioned: {match.group(0)[:100]}..." if len(match.group(0)) > 100 else match.group(0).strip()
+    return "Not specified"
+
+
+def legacy_extract_info(text: str, nlp, sections: bool = True) -> Dict[str, Any]:
+    """extract_info as it was before the single-pass extractor, kept for comparison"""
+    doc = nlp(text) if nlp is not None else None
+
+    # Email extraction
+    email = next((ent.text for ent in doc.ents if ent.label_ == "EMAIL"), None) if doc is not None else None
+    if not email:
+        emails = re.findall(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", text)
+        email = emails[0] if emails else "Not found"
+
+    # Phone extraction
+    phone = next((ent.text for ent in doc.ents if ent.label_ == "PHONE"), None) if doc is not None else None
+    if not phone:
+        phones = re.findall(r"(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", text)
+        phone = phones[0] if phones else "Not found"
+
+    # Check for both individual words and phrases
+    skills = []
+    text_lower = text.lower()
+    for skill in SKILL_SET:
+        if skill.lower() in text_lower:
+            skills.append(skill.title())
+
+    info = {"email": email, "phone": phone, "skills": skills}
+    if sections:
+        info["education"] = legacy_extract_education(text)
+        info["experience"] = legacy_extract_experience(text)
+    return info
+
+
+def load_resume_texts(resume_dir: str, limit: int) -> List[str]:
+    texts = []
+    for name in sorted(os.listdir(resume_dir)):
+        if not name.lower().endswith((".pdf", ".docx")):
+            continue
+        with open(os.path.join(resume_dir, name), "rb") as f:
+            try:
+                texts.append(extract_text_from_bytes(f.read(), name))
+            except Exception as e:
+                print(f"Skipping {name}: {e}")
+        if limit and len(texts) >= limit:
+            break
+    return texts
+
+
+def synthetic_texts(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    filler = "led team delivered project experience years bachelor university built improved".split()
+    texts = []
+    for i in range(count):
+        words = [rng.choice(filler + SKILL_SET) for _ in range(400)]
+        words.insert(5, f"candidate{i}@example.com")
+        words.insert(9, f"+1 555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}")
+        words.insert(14, f"https://github.com/candidate{i}")
+        texts.append(" ".join(words))
+    return texts
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark extract_info against the spaCy-based version.")
+    parser.add_argument("--resume-dir", default=RESUME_DIR, help="Folder of PDF/DOCX resumes to read.")
+    parser.add_argument("--limit", type=int, default=0, help="Read at most this many resumes (0 = all).")
+    parser.add_argument("--synthetic", type=int, default=0, help="Use this many generated texts instead of files.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs per extractor; the best is reported.")
+    parser.add_argument("--spacy", action="store_true", help="Also time the legacy spaCy pass (needs spaCy and en_core_web_sm, which requirement.txt no longer installs).")
+    return parser.parse_args()
+
+
+def best_time(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    args = parse_args()
+    texts = synthetic_texts(args.synthetic) if args.synthetic else load_resume_texts(args.resume_dir, args.limit)
+    if not texts:
+        raise SystemExit("No resume texts to benchmark.")
+
+    nlp = None
+    load_time = 0.0
+    if args.spacy:
+        try:
+            import spacy
+        except ImportError:
+            raise SystemExit("--spacy needs spaCy: pip install spacy && python -m spacy download en_core_web_sm")
+
+        start = time.perf_counter()
+        nlp = spacy.load("en_core_web_sm")
+        load_time = time.perf_counter() - start
+
+    legacy_results = [legacy_extract_info(text, nlp) for text in texts]
+    new_results = extract_info_batch(texts)
+
+    legacy_s = best_time(lambda: [legacy_extract_info(text, nlp) for text in texts], args.repeat)
+    new_s = best_time(lambda: extract_info_batch(texts), args.repeat)
+    # Contacts and skills alone, without the education/experience regexes both share
+    legacy_fields_s = best_time(lambda: [legacy_extract_info(text, nlp, sections=False) for text in texts], args.repeat)
+    new_fields_s = best_time(lambda: [extract_fields(text) for text in texts], args.repeat)
+
+    # Education and experience alone: whole-text searches against section-scoped ones
+    legacy_sections_s = best_time(
+        lambda: [(legacy_extract_education(text), legacy_extract_experience(text)) for text in texts], args.repeat
+    )
+    new_sections_s = best_time(
+        lambda: [
+            (extract_education(text, sections), extract_experience(text, sections))
+            for text, sections in ((text, segment_sections(text)) for text in texts)
+        ],
+        args.repeat,
+    )
+    slowest_s = 0.0
+    for text in texts:
+        start = time.perf_counter()
+        sections = segment_sections(text)
+        extract_education(text, sections)
+        extract_experience(text, sections)
+        slowest_s = max(slowest_s, time.perf_counter() - start)
+
+    print(f"Resumes: {len(texts)} ({sum(len(t) for t in texts) / len(texts):.0f} chars on average)")
+    if nlp is not None:
+        print(f"spaCy model load (legacy only): {load_time:.2f} s")
+    legacy_label = "legacy extract_info" + (" (no spaCy pass)" if nlp is None else "")
+    print(f"{legacy_label}: {legacy_s:.3f} s ({1000 * legacy_s / len(texts):.2f} ms/resume)")
+    print(f"single-pass extract_info: {new_s:.3f} s ({1000 * new_s / len(texts):.2f} ms/resume)")
+    print(f"Speedup: {legacy_s / new_s:.1f}x")
+    print(
+        f"Contacts + skills only: {1000 * legacy_fields_s / len(texts):.2f} -> "
+        f"{1000 * new_fields_s / len(texts):.2f} ms/resume ({legacy_fields_s / new_fields_s:.1f}x)"
+    )
+
+    print(
+        f"Education + experience only: {1000 * legacy_sections_s / len(texts):.2f} -> "
+        f"{1000 * new_sections_s / len(texts):.2f} ms/resume ({legacy_sections_s / new_sections_s:.1f}x), "
+        f"slowest resume {1000 * slowest_s:.2f} ms"
+    )
+
+    # Where the outputs differ. Skills now need word boundaries, so "ai" no
+    # longer matches inside "email" and "java" no longer matches inside "javascript";
+    # compounds such as "reactjs" and "github" are still credited through aliases.
+    # Education and experience are searched within their own sections with bounded
+    # gaps, so they no longer return thousands of characters spanning several sections.
+    for field in ("email", "phone", "education", "experience"):
+        same = sum(old[field] == new[field] for old, new in zip(legacy_results, new_results))
+        print(f"{field}: identical for {same}/{len(texts)}")
+    dropped, added = {}, {}
+    for old, new in zip(legacy_results, new_results):
+        for skill in set(old["skills"]) - set(new["skills"]):
+            dropped[skill] = dropped.get(skill, 0) + 1
+        for skill in set(new["skills"]) - set(old["skills"]):
+            added[skill] = added.get(skill, 0) + 1
+    print(f"skills only in legacy output: {dict(sorted(dropped.items(), key=lambda x: -x[1]))}")
+    print(f"skills only in new output: {dict(sorted(added.items(), key=lambda x: -x[1]))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,21 @@
-from typing import cast
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, cast
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, ENGLISH_STOP_WORDS, TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from scipy.sparse import csr_matrix
 import re
 from utils import preprocess_text
 
+# Parameters shared by compute_match and ResumeVocabulary.score
+NGRAM_RANGE = (1, 2)
+MAX_DF = 0.9
+KEYWORD_POINTS = 2
+MAX_KEYWORD_BONUS = 20
+# IDF of a term found in only one document of a resume/JD pair (smooth_idf with n=2)
+_PAIR_UNIQUE_IDF = np.log(3 / 2) + 1
+
+
 def compute_match(resume_text: str, jd_text: str) -> float:
     """
     Compute match percentage between resume and job description
@@ -18,9 +28,9 @@ def compute_match(resume_text: str, jd_text: str) -> float:
     # Create TF-IDF vectors with n-grams
     vectorizer = TfidfVectorizer(
         stop_words='english', 
-        ngram_range=(1, 2),
+        ngram_range=NGRAM_RANGE,
         min_df=1,
-        max_df=0.9
+        max_df=MAX_DF
     )
     
     # Cast the result of fit_transform to csr_matrix
@@ -49,12 +59,140 @@ def compute_match(resume_text: str, jd_text: str) -> float:
     for keyword in keywords:
         if keyword in resume_words:
             matched_keywords.append(keyword)
-            keyword_bonus += 2  # 2 points per matched keyword
+            keyword_bonus += KEYWORD_POINTS  # 2 points per matched keyword
     
     # Cap the bonus at 20 points
-    keyword_bonus = min(keyword_bonus, 20)
+    keyword_bonus = min(keyword_bonus, MAX_KEYWORD_BONUS)
     
     # Calculate final score (base + bonus, capped at 100)
     final_score = min(base_score + keyword_bonus, 100)
     
     return round(final_score, 2)
+
+class ResumeVectors(NamedTuple):
+    """A resume's n-gram counts and distinct words, as ids into a ResumeVocabulary"""
+    term_ids: np.ndarray
+    term_counts: np.ndarray
+    word_ids: np.ndarray
+
+
+# Tokenization, stop words and n-grams exactly as compute_match's vectorizer applies them
+_analyze = CountVectorizer(stop_words='english', ngram_range=NGRAM_RANGE).build_analyzer()
+
+
+def _rows(ids: List[np.ndarray], values: List[np.ndarray], width: int) -> csr_matrix:
+    indptr = np.concatenate([[0], np.cumsum([len(row) for row in ids])])
+    indices = np.concatenate(ids) if ids else np.zeros(0, dtype=np.int64)
+    data = np.concatenate(values) if values else np.zeros(0)
+    return csr_matrix((data, indices, indptr), shape=(len(ids), width))
+
+
+class ResumeVocabulary:
+    """
+    Term and word ids shared by vectorized resumes.
+
+    Ids are only ever added, so vectors made earlier stay valid as more
+    resumes are vectorized, and any set of them can be scored against a
+    new JD without re-reading the resumes. Terms of resumes that are no
+    longer scored stay too, so a caller that drops many resumes should
+    vectorize the rest into a new vocabulary; ``vectorized`` counts the
+    resumes seen to tell when.
+    """
+
+    def __init__(self):
+        self.terms: Dict[str, int] = {}
+        self.words: Dict[str, int] = {}
+        self.vectorized = 0
+
+    def vectorize(self, resume_text: str) -> ResumeVectors:
+        processed = preprocess_text(resume_text)
+        counts = Counter(_analyze(processed))
+        self.vectorized += 1
+        words = set(processed.lower().split())
+        return ResumeVectors(
+            np.fromiter((self.terms.setdefault(term, len(self.terms)) for term in counts), dtype=np.int64, count=len(counts)),
+            np.fromiter(counts.values(), dtype=np.float64, count=len(counts)),
+            np.fromiter((self.words.setdefault(word, len(self.words)) for word in words), dtype=np.int64, count=len(words)),
+        )
+
+    def score(self, vectors: List[ResumeVectors], jd_text: str) -> List[Optional[float]]:
+        """compute_match percentages of vectorized resumes against a JD; None where it would raise"""
+        if not vectors:
+            return []
+        jd_processed = preprocess_text(jd_text)
+        jd_counts = Counter(_analyze(jd_processed))
+        # JD terms no resume has only add to the JD's norm
+        jd_row = np.zeros(len(self.terms))
+        for term, count in jd_counts.items():
+            if term in self.terms:
+                jd_row[self.terms[term]] = count
+        jd_total = float(sum(count ** 2 for count in jd_counts.values()))
+        resume_counts = _rows([v.term_ids for v in vectors], [v.term_counts for v in vectors], len(self.terms))
+        base_scores = _pair_cosines(resume_counts, jd_row, jd_total) * 100
+
+        keyword_ids = [
+            self.words[word] for word in {
+                word.lower() for word in jd_processed.split()
+                if len(word) > 3 and word not in ENGLISH_STOP_WORDS
+            }
+            if word in self.words
+        ]
+        if keyword_ids:
+            word_matrix = _rows([v.word_ids for v in vectors], [np.ones(len(v.word_ids)) for v in vectors], len(self.words))
+            matches = np.asarray(word_matrix[:, keyword_ids].sum(axis=1)).ravel()
+        else:
+            matches = np.zeros(len(vectors))
+        bonuses = np.minimum(matches * KEYWORD_POINTS, MAX_KEYWORD_BONUS)
+        return [
+            None if np.isnan(base) else round(min(float(base) + float(bonus), 100), 2)
+            for base, bonus in zip(base_scores, bonuses)
+        ]
+
+
+def _pair_cosines(resume_counts: csr_matrix, jd_row: np.ndarray, jd_total: float) -> np.ndarray:
+    """
+    Cosine of each resume with the JD, as if a TfidfVectorizer were fitted
+    on that resume/JD pair alone (what compute_match does).
+
+    ``jd_row`` holds the JD's counts of the resume vocabulary's terms and
+    ``jd_total`` the sum of squares of all its counts.
+
+    Within a pair a term has df 1 (IDF ln(3/2)+1) or df 2 (IDF 1). With
+    max_df=0.9 a df-2 term exceeds 1.8 documents and is pruned. Both
+    vectors are L2-normalized, so only these sums are needed:
+    dot = keep * sum(r*j over shared terms)
+    |r|^2 = a^2 * (sum r^2 - shared r^2) + keep * shared r^2, and likewise for the JD.
+    A pair with no terms left is NaN: compute_match raises ValueError there.
+    """
+    keep_shared = 1.0 if 2 <= MAX_DF * 2 else 0.0
+    a2 = _PAIR_UNIQUE_IDF ** 2
+
+    jd_present = (jd_row > 0).astype(np.float64)
+    jd_squared = jd_row ** 2
+    resumes = resume_counts.astype(np.float64)
+    resume_squared = resumes.multiply(resumes).tocsr()
+
+    dot = resumes @ jd_row
+    resume_total = np.asarray(resume_squared.sum(axis=1)).ravel()
+    resume_shared = resume_squared @ jd_present
+    jd_shared = (resumes > 0).astype(np.float64) @ jd_squared
+
+    resume_norm2 = a2 * (resume_total - resume_shared) + keep_shared * resume_shared
+    jd_norm2 = a2 * (jd_total - jd_shared) + keep_shared * jd_shared
+    denominator = np.sqrt(resume_norm2) * np.sqrt(jd_norm2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cosines = np.where(denominator > 0, keep_shared * dot / denominator, 0.0)
+    cosines[(resume_norm2 + jd_norm2) == 0] = np.nan
+    return cosines
+
+
+def compute_matches(resume_texts: List[str], jd_text: str) -> List[Optional[float]]:
+    """
+    Batch version of compute_match: same percentages, one vectorization per resume.
+
+    A resume for which compute_match would raise (no terms left after
+    pruning) gets None. Keep a ResumeVocabulary and the vectors instead
+    to score the same resumes against several JDs.
+    """
+    vocabulary = ResumeVocabulary()
+    return vocabulary.score([vocabulary.vectorize(text) for text in resume_texts], jd_text)
@@ -1,12 +1,10 @@
+import io
 import pdfplumber
 import docx
-import spacy
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-nlp = spacy.load("en_core_web_sm")
-
 def extract_text_from_pdf(file) -> str:
     """Extract text from PDF file"""
     try:
@@ -32,79 +30,254 @@ def extract_text(file) -> str:
     else:
         raise ValueError("Unsupported file format. Only PDF and DOCX are supported.")
 
-def extract_education(text: str) -> str:
-    """Extract education information from resume text"""
-    patterns = [
-        # FIX: add missing closing parenthesis at the end
-        r"(?:education|academic background|qualifications)[\s\S]*?(?:(?:master|bachelor|ph\.?d|doctorate)[\s\S]*?(?:\d{4}[\s-]*(?:\d{4}|present)))",
-        r"(master['s]?|bachelor['s]?|ph\.?d|doctorate)[\s\S]*?(?:in|of)[\s\S]*?[a-z]+(?:[\s,]*\d{4})",
-        r"\b(university|college|institute)\b.*?\b(?:degree|diploma|certificate)\b"
+def extract_text_from_bytes(data: bytes, filename: str) -> str:
+    """Extract text from raw file bytes; picklable entry point for worker processes"""
+    buffer = io.BytesIO(data)
+    buffer.name = filename
+    return extract_text(buffer)
+
+# Section headings as they appear once lowercased, "&" spelled "and" and punctuation dropped
+SECTION_HEADINGS = {
+    "education": [
+        "education", "educational details", "education details", "educational qualification",
+        "educational qualifications", "academic background", "academic qualifications",
+        "academics", "qualifications", "education and certifications", "education and certification",
+        "education and credentials", "education and training",
+    ],
+    "experience": [
+        "experience", "work experience", "professional experience", "professional experiences",
+        "professional work experience", "work history", "employment", "employment history",
+        "career history", "career progression", "experience summary", "technical experience",
+        "project experience", "relevant experience",
+    ],
+    "skills": [
+        "skills", "technical skills", "skill set", "key skills", "core competencies",
+        "areas of expertise", "technical expertise", "technologies",
+    ],
+    "summary": [
+        "summary", "professional summary", "profile", "profile summary", "objective",
+        "career objective", "about me",
+    ],
+    "projects": ["projects", "major projects", "academic projects", "personal projects", "project details"],
+    "certifications": ["certifications", "certification", "certificates", "licenses and certifications"],
+    "achievements": ["achievements", "accomplishments", "awards", "awards and achievements", "honors and awards"],
+    "other": [
+        "additional information", "interests", "hobbies", "languages", "references",
+        "personal details", "personal information", "publications", "volunteer experience",
+    ],
+}
+_HEADING_TO_SECTION = {heading: name for name, headings in SECTION_HEADINGS.items() for heading in headings}
+# A heading line is short; longer lines are body text even if they start with a heading word
+MAX_HEADING_CHARS = 50
+# Field patterns never see more than this, so each search has a fixed worst case
+MAX_SECTION_CHARS = 5000
+MAX_FALLBACK_CHARS = 20000
+
+
+def _heading_key(line: str) -> str:
+    return " ".join(re.sub(r"[^a-z]+", " ", line.lower().replace("&", " and ")).split())
+
+
+def segment_sections(text: str) -> Dict[str, str]:
+    """
+    Split resume text into sections by heading lines, in one pass over its lines.
+
+    Each section keeps its heading line. Text before the first heading is
+    under "header"; sections with the same name are joined in order. A
+    heading may carry content after a colon ("Education: B.Sc ...").
+    """
+    sections: Dict[str, List[str]] = {}
+    current = sections.setdefault("header", [])
+    for line in text.splitlines():
+        stripped = line.strip()
+        if len(stripped) <= MAX_HEADING_CHARS or ":" in stripped[:MAX_HEADING_CHARS]:
+            name = _HEADING_TO_SECTION.get(_heading_key(stripped.split(":", 1)[0]))
+            if name:
+                current = sections.setdefault(name, [])
+        current.append(line)
+    return {name: "\n".join(lines) for name, lines in sections.items() if lines}
+
+
+def _search_sections(
+    patterns: List["re.Pattern[str]"],
+    text: str,
+    sections: Dict[str, str],
+    names: List[str],
+    fallback_chars: int = MAX_FALLBACK_CHARS,
+):
+    """First match of the patterns in the named sections, or in the start and end of the text if none exist"""
+    scopes = [sections[name][:MAX_SECTION_CHARS] for name in names if name in sections]
+    if not scopes:
+        # Education often closes a long resume, so the tail is searched too
+        scopes = [text[:fallback_chars]]
+        if len(text) > fallback_chars:
+            scopes.append(text[max(fallback_chars, len(text) - fallback_chars):])
+    for scope in scopes:
+        for pattern in patterns:
+            match = pattern.search(scope)
+            if match:
+                return match
+    return None
+
+
+# Gaps are bounded and the text before a year is a single letter (the gap covers the rest of the
+# word), so a search costs at most (scope length x gap) steps
+EDUCATION_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in [
+        r"(?:education|academic background|qualifications)[\s\S]{0,300}?(?:(?:master|bachelor|ph\.?d|doctorate)[\s\S]{0,200}?(?:\d{4}[\s-]*(?:\d{4}|present)))",
+        # The lookahead is atomic: only the first "in"/"of" after the degree is tried
+        r"(?=(?P<degree>(?:master['s]?|bachelor['s]?|ph\.?d|doctorate)[\s\S]{0,100}?(?:in|of)))(?P=degree)[\s\S]{0,200}?[a-z][\s,]*\d{4}",
+        r"\b(university|college|institute)\b.{0,200}?\b(?:degree|diploma|certificate)\b",
     ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return match.group(0).strip()
-    return "Not specified"
-
-def extract_experience(text: str) -> str:
-    """Extract experience information from resume text"""
+]
+# The year count is bounded and must start a number, so a run of digits costs one step per digit
+YEARS_OF_EXPERIENCE_PATTERN = re.compile(
+    r"(?:(?<!\d)\d{1,3}\+?[\s-]*(?:years?|yrs?)[\s-]*(?:experience))|(?:experience[\s\S]{0,100}?(?<!\d)\d{1,3}\+?[\s-]*(?:years?|yrs?))",
+    re.IGNORECASE,
+)
+JOB_HISTORY_PATTERN = re.compile(
+    r"(?:experience|work history|employment)[\s\S]{0,500}?(?:(?:[a-z]\s\d{4}[\s-]*(?:present|\d{4})))",
+    re.IGNORECASE,
+)
+
+
+def _section_preview(section: str, limit: int = 100) -> str:
+    """Start of a section's body, on one line, for when no pattern matched inside it"""
+    heading, _, rest = section.partition("\n")
+    # Content may follow the heading on its own line ("Education: B.Sc ...")
+    inline = heading.split(":", 1)[1] if ":" in heading else ""
+    body = " ".join(f"{inline} {rest}".split())
+    return f"{body[:limit]}..." if len(body) > limit else body
+
+
+def extract_education(text: str, sections: Optional[Dict[str, str]] = None) -> str:
+    """Extract education information from the education section of resume text"""
+    if sections is None:
+        sections = segment_sections(text)
+    match = _search_sections(EDUCATION_PATTERNS, text, sections, ["education"])
+    if match:
+        return match.group(0).strip()
+    # An education section the patterns do not recognise is still the best answer
+    return _section_preview(sections.get("education", "")) or "Not specified"
+
+def extract_experience(text: str, sections: Optional[Dict[str, str]] = None) -> str:
+    """Extract experience information from the summary and experience sections of resume text"""
+    if sections is None:
+        sections = segment_sections(text)
     # Look for years of experience
-    exp_pattern = r"(?:\d+\+?[\s-]*(?:years?|yrs?)[\s-]*(?:experience))|(?:experience[\s\S]*?\d+\+?[\s-]*(?:years?|yrs?))"
-    match = re.search(exp_pattern, text, re.IGNORECASE)
+    # A years-of-experience claim sits near the top, so a resume without headings gets a section-sized search
+    match = _search_sections(
+        [YEARS_OF_EXPERIENCE_PATTERN], text, sections, ["header", "summary", "experience"], MAX_SECTION_CHARS
+    )
     if match:
         return match.group(0).strip()
     
     # Look for job history section
-    # FIX: add missing closing parenthesis at the end
-    job_pattern = r"(?:experience|work history|employment)[\s\S]*?(?:(?:[a-z]+\s\d{4}[\s-]*(?:present|\d{4})))"
-    match = re.search(job_pattern, text, re.IGNORECASE)
+    match = _search_sections([JOB_HISTORY_PATTERN], text, sections, ["experience"])
     if match:
         return f"Experience mentioned: {match.group(0)[:100]}..." if len(match.group(0)) > 100 else match.group(0).strip()
     
-    return "Not specified"
+    preview = _section_preview(sections.get("experience", ""))
+    return f"Experience mentioned: {preview}" if preview else "Not specified"
+
+# Skills looked for in every resume, in display order
+SKILL_SET = [
+    "python", "java", "react", "aws", "sql", "html", "css",
+    "machine learning", "ai", "tensorflow", "pytorch", "docker",
+    "kubernetes", "git", "javascript", "typescript", "node.js",
+    "data analysis", "pandas", "numpy", "scikit-learn", "flask",
+    "django", "fastapi", "mongodb", "postgresql", "mysql",
+    "big data", "hadoop", "spark", "tableau", "power bi"
+]
+# Compound names that imply a skill but have no word boundary after it
+SKILL_ALIASES = {
+    "reactjs": "react", "nodejs": "node.js", "github": "git", "gitlab": "git", "pyspark": "spark",
+}
+_SKILL_ORDER = {skill: i for i, skill in enumerate(SKILL_SET)}
+
+EMAIL_PATTERN = r"[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}"
+URL_PATTERN = r"(?:https?://|www\.)[^\s<>\"')\]]+"
+PHONE_PATTERN = r"(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"
+
+
+def _trie_alternation(words: List[str]) -> str:
+    """Regex matching any of the words, factored by common prefix so each position costs one branch"""
+    tree: Dict[str, Any] = {}
+    for word in words:
+        node = tree
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + emit(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A word ending here makes the longer continuations optional, so the longest wins
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(tree)
+
+
+# One pass over the lowercased text finds every field. Emails and URLs are consumed
+# whole, so digits or skill names inside them are not reported as phones or skills.
+# Skills need word boundaries; a trailing version number ("html5") or "js" ("reactjs")
+# is allowed, and SKILL_ALIASES covers other compounds ("github").
+# Every branch is gated on its first character so the scan skips other positions fast.
+_FIELDS = (
+    rf"(?<![a-z0-9._%+-])(?P<email>{EMAIL_PATTERN})"
+    rf"|(?P<url>{URL_PATTERN})"
+    rf"|(?=[+(\d])(?P<phone>{PHONE_PATTERN})"
+    rf"|(?<!\w)(?P<skill>{_trie_alternation(SKILL_SET + list(SKILL_ALIASES))})(?:js)?(?![^\W\d])"
+)
+FIELD_PATTERN = re.compile(_FIELDS)
+# For the rare text whose lowercase form changes length (offsets would not line up)
+_FIELD_PATTERN_IGNORECASE = re.compile(_FIELDS, re.IGNORECASE)
+
+
+def extract_fields(text: str) -> Dict[str, Any]:
+    """Emails, phones, URLs and skills from one scan of the text"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        matches = FIELD_PATTERN.finditer(lowered)
+    else:
+        matches = _FIELD_PATTERN_IGNORECASE.finditer(text)
+    emails, phones, urls, skills = [], [], [], set()
+    for match in matches:
+        kind = match.lastgroup
+        # Values come from the original text to keep their case
+        value = text[match.start():match.end()]
+        if kind == "email":
+            emails.append(value)
+        elif kind == "url":
+            urls.append(value)
+        elif kind == "phone":
+            phones.append(value)
+        else:
+            skill = " ".join(value.lower().split())
+            skill = skill[:-2] if skill.endswith("js") and skill[:-2] in _SKILL_ORDER else skill
+            skills.add(SKILL_ALIASES.get(skill, skill))
+    return {
+        "email": emails[0] if emails else "Not found",
+        "phone": phones[0] if phones else "Not found",
+        "urls": urls,
+        "skills": [skill.title() for skill in sorted(skills, key=_SKILL_ORDER.__getitem__)],
+    }
+
 
 def extract_info(text: str) -> Dict[str, Any]:
     """Extract structured information from resume text"""
-    doc = nlp(text)
-    
-    # Email extraction
-    email = next((ent.text for ent in doc.ents if ent.label_ == "EMAIL"), None)
-    if not email:
-        emails = re.findall(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", text)
-        email = emails[0] if emails else "Not found"
-
-    # Phone extraction
-    phone = next((ent.text for ent in doc.ents if ent.label_ == "PHONE"), None)
-    if not phone:
-        phones = re.findall(r"(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", text)
-        phone = phones[0] if phones else "Not found"
-
-    # Skills extraction
-    skill_set = [
-        "python", "java", "react", "aws", "sql", "html", "css", 
-        "machine learning", "ai", "tensorflow", "pytorch", "docker",
-        "kubernetes", "git", "javascript", "typescript", "node.js",
-        "data analysis", "pandas", "numpy", "scikit-learn", "flask",
-        "django", "fastapi", "mongodb", "postgresql", "mysql",
-        "big data", "hadoop", "spark", "tableau", "power bi"
-    ]
-    
-    # Check for both individual words and phrases
-    skills = []
-    text_lower = text.lower()
-    for skill in skill_set:
-        if skill.lower() in text_lower:
-            skills.append(skill.title())
-    
-    # Extract education and experience
-    education = extract_education(text)
-    experience = extract_experience(text)
-    
-    return {
-        "email": email,
-        "phone": phone,
-        "skills": skills,
-        "education": education,
-        "experience": experience
-    }
\ No newline at end of file
+    info = extract_fields(text)
+    sections = segment_sections(text)
+    info["education"] = extract_education(text, sections)
+    info["experience"] = extract_experience(text, sections)
+    return info
+
+
+def extract_info_batch(texts: List[str]) -> List[Dict[str, Any]]:
+    """Extract structured information from many resume texts"""
+    return [extract_info(text) for text in texts]
@@ -0,0 +1,110 @@
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from parser import extract_info, extract_text_from_bytes
+
+MAX_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+# Files submitted but not yet consumed; caps how many file buffers and texts are held at once
+MAX_IN_FLIGHT = 2 * MAX_WORKERS
+# Resumes scored together against the JD
+SCORE_BATCH_SIZE = 16
+
+
+class ParsedResume(NamedTuple):
+    filename: str
+    text: Optional[str]
+    info: Optional[Dict[str, Any]]
+    error: Optional[str]
+
+
+NO_TERMS_ERROR = "no terms left to compare with the job description"
+WORKER_CRASH_ERROR = "the file crashed the parsing process"
+
+
+def _new_pool(max_workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def parse_files(
+    files: Iterable[Tuple[str, Callable[[], bytes]]],
+    max_workers: int = MAX_WORKERS,
+    max_in_flight: int = MAX_IN_FLIGHT,
+) -> Iterator[Tuple[int, ParsedResume]]:
+    """
+    Extract text and info from resumes, yielding each with its position in ``files`` as it completes.
+
+    ``files`` pairs a filename with a callable returning its bytes, read only
+    when the file is submitted. Text extraction runs on a process pool with
+    at most ``max_in_flight`` files outstanding; info extraction runs in the
+    calling thread behind it. Results arrive in completion order, not
+    upload order.
+
+    If a worker process dies, the pool is replaced and the files that were in
+    flight are retried one at a time, so only a file that crashes a worker on
+    its own is reported as failed.
+    """
+    numbered = enumerate(files)
+    pool = _new_pool(max_workers)
+    # future -> (index, filename, data, retrying)
+    pending = {}
+    # Files in flight when a pool broke, or refused by a broken pool
+    unsent = []
+    broken = False
+
+    def refill():
+        nonlocal broken
+        while len(pending) < max_in_flight and not broken:
+            if any(retrying for *_, retrying in pending.values()):
+                return  # A retried file runs alone
+            if unsent:
+                if unsent[-1][3] and pending:
+                    return
+                index, filename, data, retrying = unsent.pop()
+            else:
+                try:
+                    index, (filename, read) = next(numbered)
+                except StopIteration:
+                    return
+                data, retrying = read(), False
+            try:
+                future = pool.submit(extract_text_from_bytes, data, filename)
+            except BrokenProcessPool:
+                unsent.append((index, filename, data, retrying))
+                broken = True
+                return
+            pending[future] = (index, filename, data, retrying)
+
+    try:
+        refill()
+        while pending or unsent:
+            parsed = []
+            if pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, filename, data, retrying = pending.pop(future)
+                    try:
+                        text = future.result()
+                        if not text or not text.strip():
+                            raise ValueError("no readable text")
+                        parsed.append((index, ParsedResume(filename, text, extract_info(text), None)))
+                    except BrokenProcessPool:
+                        broken = True
+                        if retrying:
+                            parsed.append((index, ParsedResume(filename, None, None, WORKER_CRASH_ERROR)))
+                        else:
+                            unsent.append((index, filename, data, True))
+                    except Exception as e:
+                        parsed.append((index, ParsedResume(filename, None, None, str(e))))
+            if broken and not pending:
+                # Every future of a broken pool has failed by now; carry on with a new one
+                pool.shutdown(wait=False)
+                pool = _new_pool(max_workers)
+                broken = False
+            # Keep the pool busy while the caller handles this round
+            refill()
+            yield from parsed
+    finally:
+        pool.shutdown(cancel_futures=True)
@@ -34,7 +34,6 @@
 
 # app.py
 import streamlit as st
-import tempfile
 import pandas as pd
 from utils import extract_text_from_file
 from model import get_similarity_scores, load_classifier
@@ -56,11 +55,9 @@ if st.button("Match & Classify") and jd and uploaded_files:
     names = []
 
     for f in uploaded_files:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f.name[-5:]) as tmp:
-            tmp.write(f.read())
-            text = extract_text_from_file(tmp.name)
-            texts.append(text)
-            names.append(f.name)
+        text = extract_text_from_file(f)
+        texts.append(text)
+        names.append(f.name)
 
     # Similarity scores
     sims = get_similarity_scores(jd, texts)
@@ -12,16 +12,26 @@
 #         return '\n'.join(p.text for p in doc.paragraphs)
 #     return ''
 # utils.py
+import io
 import os
 from pdfminer.high_level import extract_text
 from docx import Document
 
-def extract_text_from_file(file_path):
-    ext = os.path.splitext(file_path)[-1].lower()
+def extract_text_from_file(source, filename=None):
+    """Text of a PDF/DOCX given as a path, raw bytes or a file-like upload."""
+    if isinstance(source, (str, os.PathLike)):
+        name = filename or os.fspath(source)
+    else:
+        name = filename or getattr(source, "name", "")
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        else:
+            source.seek(0)
+    ext = os.path.splitext(name)[-1].lower()
     if ext == ".pdf":
-        return extract_text(file_path)
+        return extract_text(source)
     elif ext == ".docx":
-        doc = Document(file_path)
+        doc = Document(source)
         return "\n".join([p.text for p in doc.paragraphs])
     else:
         return ""
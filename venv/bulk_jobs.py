@@ -0,0 +1,336 @@
+# bulk_jobs.py
+"""Background bulk screening jobs that survive reruns and restarts.
+
+A job lives in its own directory under JOBS_DIR:
+- job.json holds the spec (JD, file list) and the current status,
+- inputs/ holds the uploaded files, so the job does not depend on the session,
+- progress.jsonl gets one checkpoint line per extracted file,
+- texts/ holds the extracted text of each file.
+
+A runner thread in the Streamlit process extracts files on a worker process
+pool, then scores every resume, stores the run in results_store and marks
+the job done. A file still extracting after FILE_TIMEOUT_SECONDS is recorded
+as failed and its pool is killed and replaced; a file that crashes a worker
+on its own is recorded as failed too. Files already checkpointed are
+skipped when a job is resumed, and jobs whose runner stopped sending
+heartbeats (for example after a server restart) are picked up again by
+``resume_jobs``.
+
+inputs/ and texts/ are deleted once a job is done, and for a failed job once
+it has not been retried for FAILED_RETENTION_SECONDS; only job.json and
+progress.jsonl stay behind.
+"""
+import json
+import multiprocessing
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+JOBS_DIR = "bulk_jobs"
+MAX_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+HEARTBEAT_SECONDS = 5
+# A running job without a heartbeat for this long is considered abandoned
+STALE_SECONDS = 30
+# Wall-clock limit per file, worker start-up included
+FILE_TIMEOUT_SECONDS = float(os.environ.get("BULK_FILE_TIMEOUT", "120"))
+POLL_SECONDS = 1
+# A failed job keeps its files for a retry this long after its last attempt
+FAILED_RETENTION_SECONDS = 7 * 24 * 3600
+WORKER_CRASH_ERROR = "the file crashed the extraction process"
+
+_runners = {}
+_runners_lock = threading.Lock()
+# Serializes job.json read-modify-writes between a runner and its heartbeat
+_job_file_lock = threading.Lock()
+
+
+def _job_dir(job_id):
+    return os.path.join(JOBS_DIR, job_id)
+
+
+def _write_json(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def load_job(job_id):
+    with open(os.path.join(_job_dir(job_id), "job.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _update_job(job_id, **changes):
+    with _job_file_lock:
+        job = load_job(job_id)
+        job.update(changes)
+        _write_json(os.path.join(_job_dir(job_id), "job.json"), job)
+    return job
+
+
+def _read_checkpoints(job_id):
+    """Checkpointed files by index; a torn last line from a crash is ignored."""
+    done = {}
+    path = os.path.join(_job_dir(job_id), "progress.jsonl")
+    if not os.path.exists(path):
+        return done
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            done[entry["index"]] = entry
+    return done
+
+
+def _ends_with_newline(path):
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def _input_path(job_id, index, filename):
+    return os.path.join(_job_dir(job_id), "inputs", f"{index:06d}_{os.path.basename(filename)}")
+
+
+def _text_path(job_id, index):
+    return os.path.join(_job_dir(job_id), "texts", f"{index:06d}.txt")
+
+
+def _discard_files(job_id):
+    """Drops the uploaded files and extracted texts; the checkpoints and results stay."""
+    for name in ("inputs", "texts"):
+        shutil.rmtree(os.path.join(_job_dir(job_id), name), ignore_errors=True)
+
+
+def submit_job(job_desc, files, label=None):
+    """Persist a job for (filename, bytes) pairs and start running it."""
+    job_id = uuid.uuid4().hex
+    os.makedirs(os.path.join(_job_dir(job_id), "inputs"))
+    os.makedirs(os.path.join(_job_dir(job_id), "texts"))
+    filenames = []
+    for index, (filename, data) in enumerate(files):
+        with open(_input_path(job_id, index, filename), "wb") as f:
+            f.write(data)
+        filenames.append(filename)
+    _write_json(os.path.join(_job_dir(job_id), "job.json"), {
+        "id": job_id,
+        "label": label,
+        "job_desc": job_desc,
+        "filenames": filenames,
+        "created_at": time.time(),
+        "status": "queued",
+        "heartbeat": time.time(),
+        "run_id": None,
+        "error": None,
+    })
+    _start_runner(job_id)
+    return job_id
+
+
+def list_jobs():
+    if not os.path.isdir(JOBS_DIR):
+        return []
+    jobs = []
+    for job_id in os.listdir(JOBS_DIR):
+        try:
+            jobs.append(load_job(job_id))
+        except (OSError, json.JSONDecodeError):
+            continue
+    return sorted(jobs, key=lambda job: job["created_at"], reverse=True)
+
+
+def job_progress(job_id):
+    """Job spec plus how many files are checkpointed, which failed and which were cut short."""
+    job = load_job(job_id)
+    checkpoints = _read_checkpoints(job_id)
+    job["processed"] = len(checkpoints)
+    job["total"] = len(job["filenames"])
+    job["failures"] = [
+        (entry["filename"], entry["error"]) for entry in checkpoints.values() if entry["error"]
+    ]
+    job["notes"] = [
+        (entry["filename"], entry["note"]) for entry in checkpoints.values() if entry.get("note")
+    ]
+    job["resumable"] = job["status"] == "failed" and os.path.isdir(os.path.join(_job_dir(job_id), "inputs"))
+    return job
+
+
+def _extract_file(path, filename):
+    """Runs in a pool worker; returns the text and a truncation/timeout note."""
+    from parser import describe_limits, extract_document
+
+    # Already in a pool worker whose deadline the runner enforces
+    document = extract_document(path, filename, isolate=False)
+    return document.text, describe_limits(document)
+
+
+def _kill_pool(pool):
+    # A worker stuck inside a parser call cannot be cancelled, only terminated
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _checkpoint(log, job, index, error, note):
+    log.write(json.dumps({"index": index, "filename": job["filenames"][index], "error": error, "note": note}) + "\n")
+    log.flush()
+
+
+def _extract_pending(job_id, job, pending, log):
+    """Extracts and checkpoints the pending files, replacing the pool after a timeout or crash.
+
+    No more files are in flight than there are workers, so a submitted file
+    starts at once and its deadline counts from submission. Files in flight
+    when a worker process died are retried one at a time in a new pool, and
+    only a file that crashes it on its own is checkpointed as failed.
+    """
+    # (index, suspect) popped from the end, in upload order; a suspect runs alone
+    queue = [(index, False) for index in sorted(pending, reverse=True)]
+    while queue:
+        pool = ProcessPoolExecutor(MAX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        in_flight = {}
+        timed_out = broken = False
+        try:
+            while (queue or in_flight) and not timed_out and not (broken and not in_flight):
+                while queue and len(in_flight) < MAX_WORKERS and not broken:
+                    index, suspect = queue[-1]
+                    if in_flight and (suspect or any(s for *_, s in in_flight.values())):
+                        break
+                    filename = job["filenames"][index]
+                    try:
+                        future = pool.submit(_extract_file, _input_path(job_id, index, filename), filename)
+                    except BrokenProcessPool:
+                        broken = True
+                        break
+                    queue.pop()
+                    in_flight[future] = (index, time.monotonic() + FILE_TIMEOUT_SECONDS, suspect)
+                done, _ = wait(in_flight, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, _, suspect = in_flight.pop(future)
+                    error = note = None
+                    try:
+                        text, note = future.result()
+                        if not (text and text.strip()):
+                            error = "no readable text"
+                    except BrokenProcessPool:
+                        # Every file in flight fails with the pool; only a file alone is to blame
+                        broken = True
+                        if not suspect:
+                            queue.append((index, True))
+                            continue
+                        error = WORKER_CRASH_ERROR
+                    except Exception as e:
+                        error = str(e)
+                    if error is None:
+                        with open(_text_path(job_id, index), "w", encoding="utf-8") as f:
+                            f.write(text)
+                    # Text is on disk before its checkpoint line, so a resume never loses it
+                    _checkpoint(log, job, index, error, note)
+                now = time.monotonic()
+                for future, (index, deadline, _) in list(in_flight.items()):
+                    if now > deadline:
+                        del in_flight[future]
+                        _checkpoint(log, job, index, f"timed out after {FILE_TIMEOUT_SECONDS:.0f}s", None)
+                        timed_out = True
+        finally:
+            if in_flight or timed_out or broken:
+                _kill_pool(pool)
+            else:
+                pool.shutdown()
+        # Files cut off along with the killed pool go to the next one
+        queue.extend(sorted(((index, suspect) for index, _, suspect in in_flight.values()), reverse=True))
+
+
+def _heartbeat(job_id, stop):
+    while not stop.wait(HEARTBEAT_SECONDS):
+        _update_job(job_id, heartbeat=time.time())
+
+
+def _run(job_id):
+    stop = threading.Event()
+    beat = threading.Thread(target=_heartbeat, args=(job_id, stop), daemon=True)
+    beat.start()
+    try:
+        job = _update_job(job_id, status="extracting", heartbeat=time.time(), error=None)
+        checkpoints = _read_checkpoints(job_id)
+        pending = [i for i in range(len(job["filenames"])) if i not in checkpoints]
+
+        if pending:
+            with open(os.path.join(_job_dir(job_id), "progress.jsonl"), "a", encoding="utf-8") as log:
+                if log.tell() and not _ends_with_newline(log.name):
+                    # Start after a line torn by a crash instead of extending it
+                    log.write("\n")
+                _extract_pending(job_id, job, pending, log)
+
+        # A run already stored means only the final status update was lost
+        if not job["run_id"]:
+            _update_job(job_id, status="scoring")
+            _score(job_id, job)
+        _update_job(job_id, status="done")
+        _discard_files(job_id)
+    except Exception as e:
+        _update_job(job_id, status="failed", error=str(e))
+    finally:
+        stop.set()
+        with _runners_lock:
+            _runners.pop(job_id, None)
+
+
+def _score(job_id, job):
+    from job_matcher import compute_similarity
+    from results_store import append_results, start_run
+    from skill_matcher import extract_skills_batch
+
+    checkpoints = _read_checkpoints(job_id)
+    indices = sorted(i for i, entry in checkpoints.items() if not entry["error"])
+    if not indices:
+        raise ValueError("❌ No valid resumes processed.")
+    texts = []
+    for index in indices:
+        with open(_text_path(job_id, index), "r", encoding="utf-8") as f:
+            texts.append(f.read())
+    filenames = [job["filenames"][i] for i in indices]
+
+    scores = compute_similarity(texts, job["job_desc"])
+    all_skills = extract_skills_batch(texts)
+    run_id = start_run(label=job["label"] or f"Bulk job ({len(filenames)} resumes)", job_desc=job["job_desc"])
+    append_results(run_id, zip(filenames, scores, all_skills))
+    _update_job(job_id, run_id=run_id)
+
+
+def _start_runner(job_id):
+    with _runners_lock:
+        if job_id in _runners:
+            return
+        runner = threading.Thread(target=_run, args=(job_id,), daemon=True)
+        _runners[job_id] = runner
+        runner.start()
+
+
+def resume_jobs():
+    """Restart unfinished jobs whose runner is gone; returns the resumed job ids.
+
+    Also drops the files of failed jobs left alone past FAILED_RETENTION_SECONDS.
+    """
+    resumed = []
+    for job in list_jobs():
+        if job["status"] == "failed" and time.time() - job.get("heartbeat", 0) > FAILED_RETENTION_SECONDS:
+            _discard_files(job["id"])
+        if job["status"] in ("done", "failed") or job["id"] in _runners:
+            continue
+        if time.time() - job.get("heartbeat", 0) > STALE_SECONDS:
+            _start_runner(job["id"])
+            resumed.append(job["id"])
+    return resumed
+
+
+def retry_job(job_id):
+    """Run a failed job again, keeping the files it already extracted."""
+    _update_job(job_id, status="queued", heartbeat=time.time())
+    _start_runner(job_id)
@@ -0,0 +1,173 @@
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+
+JD_DB_FILE = "jd_library.sqlite3"
+# Previous JSON library; imported once, when the database is created
+JD_FILE = "jd_library.json"
+# PRAGMA user_version once the legacy JSON import has run
+_IMPORTED_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jds (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jds_title ON jds (title);
+CREATE TABLE IF NOT EXISTS jd_artifacts (
+    jd_id TEXT PRIMARY KEY REFERENCES jds (id) ON DELETE CASCADE,
+    jd_updated_at REAL NOT NULL,
+    producer TEXT,
+    cleaned_text TEXT,
+    skills TEXT,
+    tfidf_fit_id TEXT,
+    tfidf_vector BLOB
+);
+"""
+
+_initialized = False
+
+
+def _connect():
+    global _initialized
+    conn = sqlite3.connect(JD_DB_FILE, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    if not _initialized:
+        with conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            _import_legacy_json(conn)
+        _initialized = True
+    return conn
+
+
+def _import_legacy_json(conn):
+    """Imports the JSON library at most once per database.
+
+    The import and the user_version marker commit together, so deleting
+    every JD later does not bring the JSON entries back.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= _IMPORTED_VERSION:
+        return
+    legacy = []
+    # A database that already has JDs predates the marker and was imported then
+    if os.path.exists(JD_FILE) and not conn.execute("SELECT 1 FROM jds LIMIT 1").fetchone():
+        try:
+            with open(JD_FILE, "r") as f:
+                legacy = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            legacy = []
+    now = time.time()
+    conn.executemany(
+        "INSERT OR IGNORE INTO jds (id, title, description, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+        [(str(jd["id"]), jd["title"], jd["description"], now, now) for jd in legacy],
+    )
+    conn.execute(f"PRAGMA user_version = {_IMPORTED_VERSION}")
+
+
+def _to_dict(row):
+    return dict(row) if row is not None else None
+
+
+def load_jds():
+    with closing(_connect()) as conn:
+        rows = conn.execute("SELECT * FROM jds ORDER BY created_at, rowid").fetchall()
+    return [dict(row) for row in rows]
+
+
+def get_jd(jd_id):
+    with closing(_connect()) as conn:
+        return _to_dict(conn.execute("SELECT * FROM jds WHERE id = ?", (jd_id,)).fetchone())
+
+
+def get_jd_by_title(title):
+    with closing(_connect()) as conn:
+        return _to_dict(
+            conn.execute(
+                "SELECT * FROM jds WHERE title = ? ORDER BY updated_at DESC LIMIT 1", (title,)
+            ).fetchone()
+        )
+
+
+def save_jds(jds):
+    """Replace the whole library in one transaction."""
+    now = time.time()
+    with closing(_connect()) as conn, conn:
+        conn.execute("DELETE FROM jds")
+        conn.executemany(
+            "INSERT INTO jds (id, title, description, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            [
+                (jd["id"], jd["title"], jd["description"], jd.get("created_at", now), jd.get("updated_at", now))
+                for jd in jds
+            ],
+        )
+
+
+def add_jd(title, description):
+    jd_id = str(uuid.uuid4())
+    now = time.time()
+    with closing(_connect()) as conn, conn:
+        conn.execute(
+            "INSERT INTO jds (id, title, description, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (jd_id, title, description, now, now),
+        )
+    return jd_id
+
+
+def delete_jd(jd_id):
+    with closing(_connect()) as conn, conn:
+        conn.execute("DELETE FROM jds WHERE id = ?", (jd_id,))
+
+
+def update_jd(jd_id, new_title, new_description):
+    with closing(_connect()) as conn, conn:
+        conn.execute(
+            "UPDATE jds SET title = ?, description = ?, updated_at = ? WHERE id = ?",
+            (new_title, new_description, time.time(), jd_id),
+        )
+
+
+# --- Precomputed per-JD artifacts ---
+
+def load_artifacts(jd_ids):
+    """Stored artifacts by JD id, skipping any that are older than their JD."""
+    jd_ids = list(jd_ids)
+    found = {}
+    with closing(_connect()) as conn:
+        for start in range(0, len(jd_ids), 500):
+            chunk = jd_ids[start:start + 500]
+            rows = conn.execute(
+                "SELECT a.* FROM jd_artifacts a JOIN jds j ON j.id = a.jd_id "
+                f"WHERE a.jd_updated_at = j.updated_at AND a.jd_id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            for row in rows:
+                artifacts = dict(row)
+                artifacts["skills"] = json.loads(artifacts["skills"]) if artifacts["skills"] else []
+                found[artifacts["jd_id"]] = artifacts
+    return found
+
+
+def save_artifacts(artifacts):
+    """Store artifact dicts (as returned by load_artifacts) in one transaction."""
+    with closing(_connect()) as conn, conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO jd_artifacts "
+            "(jd_id, jd_updated_at, producer, cleaned_text, skills, tfidf_fit_id, tfidf_vector) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    a["jd_id"], a["jd_updated_at"], a["producer"], a["cleaned_text"],
+                    json.dumps(a["skills"]), a["tfidf_fit_id"], a["tfidf_vector"],
+                )
+                for a in artifacts
+            ],
+        )
@@ -0,0 +1,163 @@
+import io
+
+import numpy as np
+from scipy import sparse
+
+from jd_manager import load_artifacts, save_artifacts
+from nlp_service import model_version, process_docs
+from text_cache import cached_batch, get_text_cache
+from tfidf_index import doc_id, get_index
+
+def _clean_doc(doc):
+    return " ".join([token.lemma_ for token in doc if not token.is_stop and not token.is_punct])
+
+def _clean_batch(texts, n_process=None):
+    lowered = [text.lower() if text else "" for text in texts]
+    return [_clean_doc(doc) for doc in process_docs(lowered, n_process=n_process)]
+
+def clean_texts(texts, n_process=None):
+    """Lemmatize many texts, dropping stop words and punctuation.
+
+    Results are cached on disk by raw-text hash and spaCy model version, so
+    only texts never cleaned before go through nlp.pipe.
+    """
+    texts = [text or "" for text in texts]
+    return cached_batch(
+        get_text_cache(),
+        f"clean:{model_version()}",
+        texts,
+        lambda batch: _clean_batch(batch, n_process=n_process),
+    )
+
+def clean_text(text):
+    if not text:
+        return ""
+    return clean_texts([text])[0]
+
+def index_resumes(resume_texts, n_process=None):
+    """Add any resumes the persistent TF-IDF index has not seen; returns their doc ids."""
+    index = get_index()
+    ids = [doc_id(t) for t in resume_texts]
+    new = {d: t for d, t in zip(ids, resume_texts) if d not in index}
+    if new:
+        cleaned = clean_texts(list(new.values()), n_process=n_process)
+        if len(index) == 0 and all(len(t.strip()) == 0 for t in cleaned):
+            raise ValueError("❌ All resumes are empty after cleaning.")
+        index.add(list(new.keys()), cleaned)
+    return ids
+
+def _vector_to_bytes(vector):
+    buffer = io.BytesIO()
+    sparse.save_npz(buffer, vector)
+    return buffer.getvalue()
+
+def _vector_from_bytes(blob):
+    return sparse.load_npz(io.BytesIO(blob)).tocsr()
+
+def jd_artifacts(jds, extract_skills_batch, skills_version=""):
+    """Cleaned text, skills and TF-IDF vector for saved JDs, in the order given.
+
+    Artifacts are stored next to each JD and recomputed only for JDs edited
+    since (or produced by another spaCy model or skill list). The vector alone
+    is redone when the TF-IDF index was refitted; it is None before the
+    index's first fit. Each result carries the decoded vector under "vector".
+    """
+    producer = f"{model_version()}|{skills_version}"
+    index = get_index()
+    stored = load_artifacts(jd["id"] for jd in jds)
+
+    stale = [
+        jd for jd in jds
+        if jd["id"] not in stored or stored[jd["id"]]["producer"] != producer
+    ]
+    if stale:
+        descriptions = [jd["description"] for jd in stale]
+        for jd, cleaned, skills in zip(
+            stale, clean_texts(descriptions), extract_skills_batch(descriptions)
+        ):
+            stored[jd["id"]] = {
+                "jd_id": jd["id"],
+                "jd_updated_at": jd["updated_at"],
+                "producer": producer,
+                "cleaned_text": cleaned,
+                "skills": skills,
+                "tfidf_fit_id": None,
+                "tfidf_vector": None,
+            }
+
+    changed = {jd["id"] for jd in stale}
+    revector = [
+        stored[jd["id"]] for jd in jds
+        if stored[jd["id"]]["tfidf_fit_id"] != index.fit_id
+    ]
+    vectors = index.transform([a["cleaned_text"] for a in revector]) if revector else None
+    if vectors is not None:
+        for row, artifacts in enumerate(revector):
+            artifacts["tfidf_fit_id"] = index.fit_id
+            artifacts["tfidf_vector"] = _vector_to_bytes(vectors[row])
+            changed.add(artifacts["jd_id"])
+    if changed:
+        save_artifacts([stored[jd_id] for jd_id in changed])
+
+    results = []
+    for jd in jds:
+        artifacts = dict(stored[jd["id"]])
+        fresh = artifacts["tfidf_vector"] is not None and artifacts["tfidf_fit_id"] == index.fit_id
+        artifacts["vector"] = _vector_from_bytes(artifacts["tfidf_vector"]) if fresh else None
+        results.append(artifacts)
+    return results
+
+def compute_similarity(resume_texts, job_desc, n_process=None, job_artifacts=None):
+    """Score resumes against a JD; stored JD artifacts skip cleaning the JD again."""
+    try:
+        job_text = job_artifacts["cleaned_text"] if job_artifacts else clean_text(job_desc)
+
+        if not job_text.strip():
+            raise ValueError("❌ Job description is empty after cleaning.")
+
+        ids = index_resumes(resume_texts, n_process=n_process)
+        index = get_index()
+
+        if all(len(index.cleaned_text(d).strip()) == 0 for d in ids):
+            raise ValueError("❌ All resumes are empty after cleaning.")
+
+        # Only the JD is transformed; resume vectors come from the saved index
+        if job_artifacts and job_artifacts["tfidf_fit_id"] == index.fit_id and job_artifacts["vector"] is not None:
+            return index.scores(ids, query_vector=job_artifacts["vector"])
+        return index.scores(ids, job_text)
+
+    except Exception as e:
+        raise RuntimeError(f"💥 compute_similarity failed: {e}")
+
+def rank_jds_for_resumes(resume_texts, jds, extract_skills_batch, skills_version="", top_k=3, n_process=None):
+    """Top-k saved JDs for every resume, from one resume x JD similarity matrix.
+
+    Returns (top_indices, top_scores, artifacts): for resume i, top_indices[i]
+    lists positions in ``jds`` by descending score and top_scores[i] the
+    matching cosine similarities.
+    """
+    try:
+        if not jds:
+            raise ValueError("❌ The JD library is empty.")
+
+        # Indexing first: the first upload may fit the vocabulary the JD vectors need
+        ids = index_resumes(resume_texts, n_process=n_process)
+        index = get_index()
+        artifacts = jd_artifacts(jds, extract_skills_batch, skills_version)
+
+        if any(a["vector"] is None for a in artifacts):
+            raise ValueError("❌ JD vectors could not be built; the TF-IDF index is not fitted.")
+        jd_matrix = sparse.vstack([a["vector"] for a in artifacts], format="csr")
+
+        # Rows are L2-normalized, so one sparse product gives every cosine
+        similarity = (index.vectors(ids) @ jd_matrix.T).toarray()
+
+        k = min(top_k, len(jds))
+        top = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(similarity, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        return top, np.take_along_axis(top_scores, order, axis=1), artifacts
+
+    except Exception as e:
+        raise RuntimeError(f"💥 rank_jds_for_resumes failed: {e}")
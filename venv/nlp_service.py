@@ -0,0 +1,41 @@
+# nlp_service.py
+"""Shared spaCy pipeline for every page of the screening app.
+
+The model is loaded once per process, on first use, without the dependency
+parser and NER: lemmatizing only needs the tagger, attribute ruler and
+lemmatizer, and phrase/keyword matching only needs the tokenizer.
+"""
+import os
+from functools import lru_cache
+
+import spacy
+
+MODEL_NAME = "en_core_web_sm"
+EXCLUDED_COMPONENTS = ["parser", "ner"]
+BATCH_SIZE = 64
+# Worker processes for nlp.pipe on large batches; 1 keeps everything in-process
+N_PROCESS = int(os.environ.get("NLP_N_PROCESS", "1"))
+
+
+@lru_cache(maxsize=1)
+def get_nlp():
+    """Load the slim pipeline once and reuse it for every caller."""
+    return spacy.load(MODEL_NAME, exclude=EXCLUDED_COMPONENTS)
+
+
+@lru_cache(maxsize=1)
+def model_version():
+    """Identifies the pipeline for cache keys, without loading it."""
+    return f"{MODEL_NAME}-{spacy.util.get_package_version(MODEL_NAME)}"
+
+
+def make_docs(texts, batch_size=BATCH_SIZE):
+    """Tokenizer-only docs, enough for stop-word/punctuation checks and PhraseMatcher."""
+    return list(get_nlp().tokenizer.pipe(texts, batch_size=batch_size))
+
+
+def process_docs(texts, batch_size=BATCH_SIZE, n_process=None):
+    """Docs with tags and lemmas, batched through nlp.pipe."""
+    return list(
+        get_nlp().pipe(texts, batch_size=batch_size, n_process=n_process or N_PROCESS)
+    )
@@ -0,0 +1,92 @@
+import streamlit as st
+from bulk_jobs import job_progress, list_jobs, resume_jobs, retry_job, submit_job
+from results_store import top_results
+
+# Jobs left unfinished by a restart continue from their last checkpoint
+resume_jobs()
+
+st.title("📁 Bulk Resume Screening (Upload Resumes)")
+
+job_desc = st.text_area("📝 Paste Job Description", height=200)
+
+# REMOVE 'type' argument to avoid Streamlit's built-in filtering error
+uploaded_files = st.file_uploader("Upload Resumes (PDF or DOCX)", accept_multiple_files=True)  # <--
+
+if uploaded_files:
+    # Now filter manually for allowed extensions
+    allowed_exts = (".pdf", ".docx")
+    filtered_files = [file for file in uploaded_files if file.name.lower().endswith(allowed_exts)]
+    unsupported_files = [file.name for file in uploaded_files if not file.name.lower().endswith(allowed_exts)]
+
+    if unsupported_files:
+        st.warning(f"Unsupported file types ignored: {', '.join(unsupported_files)}")
+else:
+    filtered_files = []
+
+if st.button("🚀 Start Screening"):
+
+    if not job_desc.strip():
+        st.error("Please paste the Job Description.")
+    elif not filtered_files:
+        st.error("Please upload one or more resumes with supported file extensions (.pdf, .docx).")
+    else:
+        # Files and JD are persisted with the job, so it outlives reruns and refreshes
+        st.session_state.bulk_job_id = submit_job(
+            job_desc,
+            [(file.name, file.getvalue()) for file in filtered_files],
+            label=f"Bulk screening ({len(filtered_files)} resumes)",
+        )
+        st.info("🔄 Started resume processing in the background...")
+
+jobs = list_jobs()
+if jobs:
+    job_labels = {
+        job["id"]: f"{job['label'] or job['id'][:8]} — {job['status']}" for job in jobs
+    }
+    default_id = st.session_state.get("bulk_job_id", jobs[0]["id"])
+    selected_job_id = st.selectbox(
+        "Screening job",
+        list(job_labels),
+        index=list(job_labels).index(default_id) if default_id in job_labels else 0,
+        format_func=job_labels.get,
+    )
+    st.session_state.bulk_job_id = selected_job_id
+
+    @st.fragment(run_every=2)
+    def job_status_panel():
+        job = job_progress(st.session_state.bulk_job_id)
+        if job["status"] in ("queued", "extracting", "scoring"):
+            st.progress(job["processed"] / max(job["total"], 1))
+            stage = "👉 Calculating similarity..." if job["status"] == "scoring" else "👉 Extracting text..."
+            st.text(f"{stage} {job['processed']}/{job['total']} files")
+            return
+        # Finished jobs render once in the full script run below
+        if st.session_state.get("bulk_job_rendered") != (job["id"], job["status"]):
+            st.session_state.bulk_job_rendered = (job["id"], job["status"])
+            st.rerun()
+
+    job = job_progress(selected_job_id)
+    if job["status"] in ("queued", "extracting", "scoring"):
+        job_status_panel()
+    else:
+        st.session_state.bulk_job_rendered = (job["id"], job["status"])
+        for filename, error in job["failures"]:
+            st.warning(f"❌ {filename} skipped — {error}")
+        for filename, note in job["notes"]:
+            st.warning(f"⚠️ {filename}: {note}.")
+
+        if job["status"] == "failed":
+            st.error(f"❌ Job failed: {job['error']}")
+            if not job["resumable"]:
+                st.info("The uploaded files of this job have been cleared; submit them again to rerun it.")
+            elif st.button("🔁 Resume Job"):
+                retry_job(job["id"])
+                st.rerun()
+        else:
+            ranked = top_results(run_id=job["run_id"], limit=job["total"])
+
+            st.subheader("🏆 Top Matches")
+            for i, row in enumerate(ranked, 1):
+                st.write(f"**{i}. {row['filename']}** — Similarity: `{row['score']:.4f}`")
+
+            st.success(f"✅ {len(ranked)} resumes processed!")
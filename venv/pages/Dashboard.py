@@ -0,0 +1,82 @@
+import streamlit as st
+from datetime import date, datetime, time, timedelta, timezone
+import pandas as pd
+import altair as alt
+from results_store import count_results, list_runs, skill_counts, top_results
+
+st.set_page_config(page_title="Resume Screening Dashboard", page_icon="📊", layout="wide")
+
+st.title("📈 Resume Screening Dashboard")
+
+runs = list_runs()
+if not runs:
+    st.warning("No data available yet. Run Bulk Screening first.")
+else:
+    # Sidebar controls
+    st.sidebar.header("Settings")
+    scope = st.sidebar.radio("Show results for", ["Single run", "Time range"])
+    run_id, since, until = None, None, None
+    if scope == "Single run":
+        run_labels = {
+            run["id"]: f"{datetime.fromtimestamp(run['created_at']):%Y-%m-%d %H:%M} — {run['label'] or run['id'][:8]}"
+            for run in runs
+        }
+        run_id = st.sidebar.selectbox("Run", list(run_labels), format_func=run_labels.get)
+    else:
+        picked = st.sidebar.date_input(
+            "Date range (UTC)", value=(date.today() - timedelta(days=30), date.today())
+        )
+        # Holds a single date while the end of the range is still being picked,
+        # and nothing once the input is cleared; an empty range means all time
+        if len(picked) > 0:
+            start_day, end_day = picked[0], picked[-1]
+            since = datetime.combine(start_day, time.min, tzinfo=timezone.utc).timestamp()
+            until = datetime.combine(end_day + timedelta(days=1), time.min, tzinfo=timezone.utc).timestamp()
+    top_n = st.sidebar.slider("Show Top N Resumes", min_value=1, max_value=20, value=5)
+    skill_filter = st.sidebar.text_input("Filter Skills by Name (case-insensitive)")
+    max_skills = st.sidebar.slider("Max Skills Shown", min_value=5, max_value=100, value=30)
+
+    ranked = top_results(run_id=run_id, since=since, until=until, limit=top_n)
+    skills = skill_counts(run_id=run_id, since=since, until=until, name_filter=skill_filter, limit=max_skills)
+
+    total_resumes = count_results(run_id=run_id, since=since, until=until)
+    st.markdown(f"### 🗂️ Total Resumes Processed: **{total_resumes}**")
+
+    # Top Ranked Resumes Section
+    with st.expander("🏆 Top Ranked Resumes", expanded=True):
+        if ranked:
+            for i, row in enumerate(ranked, 1):
+                st.markdown(f"**{i}. {row['filename']}** — Similarity Score: `{row['score']:.4f}`")
+        else:
+            st.info("No ranked resumes found.")
+
+    # Skills Section
+    with st.expander("🔥 Top Skills from All Resumes", expanded=True):
+        if skills or skill_filter:
+            # Filtered, sorted and limited in the store's pre-aggregated counts
+            if not skills:
+                st.info("No skills match your filter.")
+            else:
+                df_skills = pd.DataFrame(skills, columns=["Skill", "Count"])
+                df_skills["Percent"] = (df_skills["Count"] / df_skills["Count"].sum()) * 100
+
+                # Altair horizontal bar chart with percentages
+                chart = (
+                    alt.Chart(df_skills)
+                    .mark_bar(color="#007FFF")
+                    .encode(
+                        x=alt.X("Count:Q", title="Count"),
+                        y=alt.Y("Skill:N", sort='-x', title="Skill"),
+                        tooltip=["Skill", "Count", alt.Tooltip("Percent", format=".2f")]
+                    )
+                )
+
+                text = chart.mark_text(
+                    align='left',
+                    baseline='middle',
+                    dx=3  # Nudges text to right so it doesn't overlap bars
+                ).encode(text=alt.Text("Percent", format=".2f"))
+
+                st.altair_chart(chart + text, use_container_width=True)
+        else:
+            st.info("No skills extracted.")
@@ -0,0 +1,228 @@
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+
+import mammoth
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LAParams, LTTextContainer
+
+from text_cache import TextCache
+
+# Extracted text by file content hash, separate from (and capped apart from) the NLP caches
+EXTRACT_CACHE_PATH = os.path.join("cache", "extract_cache.sqlite3")
+EXTRACT_CACHE_MAX_BYTES = 128 * 1024 * 1024
+EXTRACTORS = {".pdf": "pdfminer.six", ".docx": "mammoth"}
+
+# Per-document budgets; a resume rarely needs more than a few pages
+MAX_PAGES = int(os.environ.get("PARSER_MAX_PAGES", "20"))
+MAX_CHARS = int(os.environ.get("PARSER_MAX_CHARS", "100000"))
+# Checked between pages, where the text so far is kept; a single pathological
+# page is stopped by killing its worker process once the grace period is over
+PDF_TIMEOUT_SECONDS = float(os.environ.get("PARSER_PDF_TIMEOUT", "30"))
+PDF_KILL_GRACE_SECONDS = 5
+PDF_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+# pdfminer's default layout analysis, so text comes out in its usual reading order
+PDF_LAYOUT = {"line_margin": 0.5, "char_margin": 2.0, "word_margin": 0.1, "boxes_flow": 0.5, "detect_vertical": False}
+
+ExtractedDocument = namedtuple("ExtractedDocument", ["text", "pages", "truncated", "timed_out"])
+
+def _as_stream(source):
+    """Paths pass through; bytes and uploads become a seekable in-memory stream."""
+    if isinstance(source, (str, os.PathLike)):
+        return source
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    source.seek(0)
+    return source
+
+def _source_name(source, filename):
+    if filename:
+        return filename
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    return getattr(source, "name", "")
+
+def iter_pdf_pages(source, layout=None, max_pages=None):
+    """Yield the text of each page in turn; later pages are never laid out if not consumed."""
+    laparams = LAParams(**(PDF_LAYOUT if layout is None else layout))
+    for page in extract_pages(_as_stream(source), laparams=laparams, maxpages=max_pages or 0):
+        yield "".join(element.get_text() for element in page if isinstance(element, LTTextContainer))
+
+def extract_pdf(source, max_pages=MAX_PAGES, max_chars=MAX_CHARS, timeout=PDF_TIMEOUT_SECONDS, layout=None):
+    """Stream pages until the page, character or time budget runs out."""
+    deadline = time.monotonic() + timeout if timeout else None
+    parts, chars, pages = [], 0, 0
+    truncated = timed_out = False
+    pages_iter = iter_pdf_pages(source, layout=layout, max_pages=max_pages + 1 if max_pages else None)
+    for page_text in pages_iter:
+        if max_pages and pages == max_pages:
+            # The extra page only tells us the document is longer than the budget
+            truncated = True
+            break
+        pages += 1
+        # Only text actually cut is truncation; after an exact fill the next page's text proves it
+        if max_chars and chars + len(page_text) > max_chars:
+            parts.append(page_text[:max_chars - chars])
+            truncated = True
+            break
+        parts.append(page_text)
+        chars += len(page_text)
+        if deadline and time.monotonic() > deadline:
+            timed_out = True
+            break
+    pages_iter.close()
+    return ExtractedDocument("".join(parts), pages, truncated, timed_out)
+
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+# No more PDFs in flight than workers, so a deadline counts from a real start
+_pdf_slots = threading.BoundedSemaphore(PDF_WORKERS)
+
+def _get_pdf_pool():
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            # Spawned, not forked: the Streamlit server is multi-threaded
+            _pdf_pool = ProcessPoolExecutor(PDF_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pdf_pool
+
+def _kill_pdf_pool(pool):
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is pool:
+            _pdf_pool = None
+    # A worker stuck inside pdfminer cannot be cancelled, only terminated
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def extract_pdf_isolated(data, max_pages=MAX_PAGES, max_chars=MAX_CHARS, timeout=PDF_TIMEOUT_SECONDS, layout=None):
+    """extract_pdf on PDF bytes in a worker process, killed if it outlives ``timeout``.
+
+    A kill returns an empty timed-out document. A file in flight on a pool
+    that another file's timeout killed is resubmitted once.
+    """
+    limit = timeout + PDF_KILL_GRACE_SECONDS if timeout else None
+    for attempt in range(2):
+        with _pdf_slots:
+            pool = _get_pdf_pool()
+            try:
+                future = pool.submit(extract_pdf, data, max_pages, max_chars, timeout, layout)
+                return future.result(timeout=limit)
+            except FutureTimeoutError:
+                _kill_pdf_pool(pool)
+                return ExtractedDocument("", 0, False, True)
+            except (BrokenProcessPool, CancelledError):
+                _kill_pdf_pool(pool)
+                if attempt:
+                    raise
+
+def parse_pdf(source):
+    return extract_pdf(source).text
+
+def parse_docx(source):
+    try:
+        stream = _as_stream(source)
+        if isinstance(stream, (str, os.PathLike)):
+            with open(stream, "rb") as docx_file:
+                result = mammoth.extract_raw_text(docx_file)
+        else:
+            result = mammoth.extract_raw_text(stream)
+        return result.value.strip()
+    except Exception as e:
+        raise Exception(f"Mammoth DOCX read failed: {e}")
+
+def extract_docx(source, max_chars=MAX_CHARS):
+    text = parse_docx(source)
+    truncated = bool(max_chars) and len(text) > max_chars
+    return ExtractedDocument(text[:max_chars] if truncated else text, None, truncated, False)
+
+@lru_cache(maxsize=1)
+def get_extract_cache():
+    return TextCache(EXTRACT_CACHE_PATH, EXTRACT_CACHE_MAX_BYTES)
+
+@lru_cache(maxsize=None)
+def extractor_id(ext):
+    """Extractor package and version, so an upgrade never serves old extractions."""
+    package = EXTRACTORS[ext]
+    try:
+        return f"{package}-{version(package)}"
+    except PackageNotFoundError:
+        return f"{package}-unknown"
+
+def _read_bytes(source):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    source.seek(0)
+    return source.read()
+
+def extract_document(source, filename=None, use_cache=True, max_pages=MAX_PAGES, max_chars=MAX_CHARS,
+                     timeout=PDF_TIMEOUT_SECONDS, layout=None, isolate=True):
+    """Extract text from a path, raw bytes or a file-like upload, within budgets.
+
+    The format comes from ``filename`` or, failing that, the path or the
+    object's ``name``; uploads are parsed straight from memory. Results are
+    cached by file content hash, extractor version and budgets, so a
+    re-uploaded resume skips parsing. Timed-out extractions are not cached.
+
+    PDFs are parsed in a worker process so ``timeout`` holds as a wall-clock
+    limit; ``isolate=False`` parses in the calling process, for callers that
+    already run in a worker with a deadline of their own.
+    """
+    name = _source_name(source, filename).lower()
+    ext = os.path.splitext(name)[1]
+    if ext == ".pdf" and isolate:
+        def parse(src):
+            return extract_pdf_isolated(_read_bytes(src), max_pages=max_pages, max_chars=max_chars,
+                                        timeout=timeout, layout=layout)
+    elif ext == ".pdf":
+        def parse(src):
+            return extract_pdf(src, max_pages=max_pages, max_chars=max_chars, timeout=timeout, layout=layout)
+    elif ext == ".docx":
+        def parse(src):
+            return extract_docx(src, max_chars=max_chars)
+    else:
+        # An unnamed source may be a whole upload; only its type belongs in the message
+        raise ValueError(f"❌ Unsupported file format: {name or f'unnamed {type(source).__name__}'}")
+    if not use_cache:
+        return parse(source)
+
+    data = _read_bytes(source)
+    key = hashlib.sha256(data).hexdigest()
+    settings = json.dumps([max_pages, max_chars, PDF_LAYOUT if layout is None else layout], sort_keys=True)
+    namespace = f"extract:{extractor_id(ext)}:{hashlib.sha256(settings.encode('utf-8')).hexdigest()[:12]}"
+    cache = get_extract_cache()
+    cached = cache.get_many(namespace, [key])
+    if key in cached:
+        return ExtractedDocument(*json.loads(cached[key]))
+    document = parse(data)
+    if not document.timed_out:
+        cache.put_many(namespace, {key: json.dumps(list(document))})
+    return document
+
+def describe_limits(document):
+    """Short note for the UI when a document was cut short, else None."""
+    if document.timed_out and not document.pages:
+        return "extraction timed out before the first page; no text was recovered"
+    if document.timed_out:
+        return f"extraction timed out after {document.pages} page(s); text is partial"
+    if document.truncated:
+        return "document exceeded the page/character budget; text was truncated"
+    return None
+
+def extract_text_from_file(source, filename=None, use_cache=True):
+    """Text only, for callers that do not report truncation."""
+    return extract_document(source, filename, use_cache=use_cache).text
@@ -0,0 +1,226 @@
+# results_store.py
+"""Append-only history of bulk screening runs.
+
+Every run gets an id; its per-resume scores and skills are appended and
+never rewritten. Skill counts are aggregated as results arrive, per run and
+per UTC day, so the dashboard reads small pre-aggregated tables instead of
+re-counting every stored resume.
+"""
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from datetime import datetime, timezone
+
+RESULTS_DB_FILE = "results.sqlite3"
+# Previous single-run output; imported once, when the store is created
+LEGACY_RESULTS_FILE = "results.json"
+# PRAGMA user_version once the legacy JSON import has run
+_IMPORTED_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    label TEXT,
+    job_desc TEXT,
+    resume_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_runs_created ON runs (created_at);
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL REFERENCES runs (id),
+    filename TEXT NOT NULL,
+    score REAL NOT NULL,
+    skills TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_run_score ON results (run_id, score DESC);
+CREATE INDEX IF NOT EXISTS idx_results_created ON results (created_at);
+CREATE TABLE IF NOT EXISTS run_skill_counts (
+    run_id TEXT NOT NULL,
+    skill TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (run_id, skill)
+);
+CREATE TABLE IF NOT EXISTS daily_skill_counts (
+    day TEXT NOT NULL,
+    skill TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (day, skill)
+);
+"""
+
+_initialized = False
+
+
+def _day(timestamp):
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _connect():
+    global _initialized
+    conn = sqlite3.connect(RESULTS_DB_FILE, timeout=30)
+    conn.row_factory = sqlite3.Row
+    if not _initialized:
+        with conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            _import_legacy_results(conn)
+        _initialized = True
+    return conn
+
+
+def _import_legacy_results(conn):
+    """Imports the JSON results at most once per database.
+
+    The import and the user_version marker commit together, so deleting
+    every run later does not bring the JSON results back.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= _IMPORTED_VERSION:
+        return
+    legacy = None
+    # A store that already has runs predates the marker and was imported then
+    if os.path.exists(LEGACY_RESULTS_FILE) and not conn.execute("SELECT 1 FROM runs LIMIT 1").fetchone():
+        try:
+            with open(LEGACY_RESULTS_FILE, "r") as f:
+                legacy = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            legacy = None
+    if legacy is not None:
+        # The old file kept only overall skill counts, so imported rows have no per-resume skills
+        run_id = _insert_run(conn, f"Imported from {LEGACY_RESULTS_FILE}", None, time.time())
+        _append(conn, run_id, [(name, score, []) for name, score in legacy.get("ranked", [])])
+        _add_skill_counts(conn, run_id, time.time(), legacy.get("skills", {}))
+    conn.execute(f"PRAGMA user_version = {_IMPORTED_VERSION}")
+
+
+def _insert_run(conn, label, job_desc, created_at):
+    run_id = uuid.uuid4().hex
+    conn.execute(
+        "INSERT INTO runs (id, created_at, label, job_desc) VALUES (?, ?, ?, ?)",
+        (run_id, created_at, label, job_desc),
+    )
+    return run_id
+
+
+def _add_skill_counts(conn, run_id, created_at, counts):
+    counts = list(counts.items())
+    conn.executemany(
+        "INSERT INTO run_skill_counts (run_id, skill, count) VALUES (?, ?, ?) "
+        "ON CONFLICT (run_id, skill) DO UPDATE SET count = count + excluded.count",
+        [(run_id, skill, n) for skill, n in counts],
+    )
+    conn.executemany(
+        "INSERT INTO daily_skill_counts (day, skill, count) VALUES (?, ?, ?) "
+        "ON CONFLICT (day, skill) DO UPDATE SET count = count + excluded.count",
+        [(_day(created_at), skill, n) for skill, n in counts],
+    )
+
+
+def _append(conn, run_id, rows):
+    now = time.time()
+    conn.executemany(
+        "INSERT INTO results (run_id, filename, score, skills, created_at) VALUES (?, ?, ?, ?, ?)",
+        [(run_id, name, float(score), json.dumps(skills), now) for name, score, skills in rows],
+    )
+    counts = {}
+    for _, _, skills in rows:
+        for skill in set(skills):
+            counts[skill] = counts.get(skill, 0) + 1
+    _add_skill_counts(conn, run_id, now, counts)
+    conn.execute(
+        "UPDATE runs SET resume_count = resume_count + ? WHERE id = ?", (len(rows), run_id)
+    )
+
+
+def start_run(label=None, job_desc=None):
+    """Open a new run and return its id."""
+    with closing(_connect()) as conn, conn:
+        return _insert_run(conn, label, job_desc, time.time())
+
+
+def append_results(run_id, rows):
+    """Append (filename, score, skills) rows to a run and fold their skills into the counts."""
+    rows = list(rows)
+    if not rows:
+        return
+    with closing(_connect()) as conn, conn:
+        _append(conn, run_id, rows)
+
+
+def list_runs(limit=100):
+    with closing(_connect()) as conn:
+        rows = conn.execute(
+            "SELECT * FROM runs ORDER BY created_at DESC LIMIT ?", (limit,)
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def _result_filter(run_id, since, until):
+    clauses, params = [], []
+    if run_id is not None:
+        clauses.append("run_id = ?")
+        params.append(run_id)
+    if since is not None:
+        clauses.append("created_at >= ?")
+        params.append(since)
+    if until is not None:
+        clauses.append("created_at < ?")
+        params.append(until)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+def count_results(run_id=None, since=None, until=None):
+    where, params = _result_filter(run_id, since, until)
+    with closing(_connect()) as conn:
+        (count,) = conn.execute(f"SELECT COUNT(*) FROM results{where}", params).fetchone()
+    return count
+
+
+def top_results(run_id=None, since=None, until=None, limit=10):
+    """Highest-scoring resumes of a run or a time range (timestamps in seconds)."""
+    where, params = _result_filter(run_id, since, until)
+    with closing(_connect()) as conn:
+        rows = conn.execute(
+            f"SELECT run_id, filename, score, skills, created_at FROM results{where} "
+            "ORDER BY score DESC LIMIT ?",
+            [*params, limit],
+        ).fetchall()
+    return [dict(row, skills=json.loads(row["skills"])) for row in rows]
+
+
+def skill_counts(run_id=None, since=None, until=None, name_filter="", limit=None):
+    """Number of resumes mentioning each skill, most frequent first.
+
+    With a run id the run's own counts are used; otherwise the daily counts
+    are summed over the UTC days touched by [since, until).
+    """
+    params = []
+    if run_id is not None:
+        query = "SELECT skill, count FROM run_skill_counts WHERE run_id = ?"
+        params.append(run_id)
+    else:
+        query = "SELECT skill, SUM(count) AS count FROM daily_skill_counts WHERE 1 = 1"
+        if since is not None:
+            query += " AND day >= ?"
+            params.append(_day(since))
+        if until is not None:
+            # until is exclusive; a midnight bound must not pull in the next day
+            query += " AND day <= ?"
+            params.append(_day(until - 1))
+    if name_filter:
+        # The filter is a plain substring, so LIKE wildcards in it are escaped
+        escaped = name_filter.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        query += " AND skill LIKE ? ESCAPE '\\'"
+        params.append(f"%{escaped}%")
+    if run_id is None:
+        query += " GROUP BY skill"
+    query += " ORDER BY count DESC"
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+    with closing(_connect()) as conn:
+        return [(row["skill"], row["count"]) for row in conn.execute(query, params).fetchall()]
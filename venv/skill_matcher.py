@@ -0,0 +1,148 @@
+# skill_matcher.py
+"""Skill extraction against the shared skill taxonomy.
+
+``data/skills_taxonomy.json`` lists canonical skills with their aliases. Each
+surface form is tokenized with the spaCy tokenizer and compiled into one
+token-level Aho-Corasick automaton, so a resume is scanned in a single pass
+over its lowercased tokens no matter how many skills the taxonomy holds.
+Matches map back to canonical names through a plain dict.
+
+Forms listed under ``context_aliases`` are ordinary words or short acronyms
+("hr", "pip", "ann", "spark"). They count only when the same text also holds
+an unambiguous form of some skill in the same category, so "HR" is kept next
+to "payroll" but a stray "hr" in "24 hr support" is not.
+"""
+import hashlib
+import json
+import os
+from collections import deque
+from functools import lru_cache
+
+from nlp_service import get_nlp, make_docs, model_version
+from text_cache import cached_batch, get_text_cache
+
+TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skills_taxonomy.json")
+
+
+def load_taxonomy(path=TAXONOMY_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class SkillMatcher:
+    """Token-level Aho-Corasick automaton over every alias in a taxonomy."""
+
+    def __init__(self, taxonomy, tokenize):
+        self.alias_to_skill = {}
+        self.categories = {}
+        gated = {}
+        for entry in taxonomy["skills"]:
+            name = entry["name"].lower()
+            self.categories[name] = entry.get("category")
+            forms = list(entry.get("aliases", []))
+            if entry.get("match_name", True):
+                forms.append(name)
+            for form in forms:
+                self.alias_to_skill[form.lower()] = name
+            for form in entry.get("context_aliases", []):
+                gated.setdefault(form.lower(), name)
+        for form, name in gated.items():
+            self.alias_to_skill.setdefault(form, name)
+
+        # Trie over token tuples; state 0 is the root
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for alias, skill in self.alias_to_skill.items():
+            tokens = tokenize(alias)
+            if tokens:
+                self._insert(tokens, (skill, gated.get(alias) == skill))
+        self._link()
+
+    def _insert(self, tokens, output):
+        state = 0
+        for token in tokens:
+            nxt = self._goto[state].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = nxt
+        if output not in self._output[state]:
+            self._output[state].append(output)
+
+    def _link(self):
+        """Breadth-first failure links; outputs inherit those of their fail state."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] = self._output[nxt] + [
+                    s for s in self._output[self._fail[nxt]] if s not in self._output[nxt]
+                ]
+
+    def canonical(self, alias):
+        """Canonical skill for an alias, or the lowercased alias if it is unknown."""
+        return self.alias_to_skill.get(alias.lower(), alias.lower())
+
+    def match_tokens(self, tokens):
+        """Canonical skills found in a token sequence, unique, in order of first match.
+
+        A skill seen only through context aliases is kept when an unambiguous
+        match confirms its category.
+        """
+        found = {}
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for token in tokens:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for skill, gated in output[state]:
+                found[skill] = found.get(skill, True) and gated
+        confirmed = {self.categories[skill] for skill, gated in found.items() if not gated}
+        return [skill for skill, gated in found.items() if not gated or self.categories[skill] in confirmed]
+
+
+def _tokens(doc):
+    return [token.text for token in doc if not token.is_space]
+
+
+@lru_cache(maxsize=1)
+def get_skill_matcher():
+    tokenizer = get_nlp().tokenizer
+    return SkillMatcher(load_taxonomy(), lambda text: _tokens(tokenizer(text.lower())))
+
+
+@lru_cache(maxsize=1)
+def skills_version():
+    """Identifies the taxonomy and tokenizer, for cache keys and stored JD artifacts."""
+    with open(TAXONOMY_PATH, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:12]
+    return f"{model_version()}:{digest}"
+
+
+def _extract_skills_uncached(texts):
+    matcher = get_skill_matcher()
+    lowered = [text.lower() if text else "" for text in texts]
+    return [matcher.match_tokens(_tokens(doc)) for doc in make_docs(lowered)]
+
+
+def extract_skills_batch(texts):
+    """Canonical skills for many texts; only texts not seen before are tokenized, in one batch."""
+    return cached_batch(
+        get_text_cache(), f"skills:{skills_version()}", texts, _extract_skills_uncached,
+        encode=json.dumps, decode=json.loads,
+    )
+
+
+def extract_skills(text):
+    return extract_skills_batch([text])[0]
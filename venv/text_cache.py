@@ -0,0 +1,125 @@
+# text_cache.py
+"""Disk-backed, size-bounded cache of derived text keyed by content hash.
+
+Entries live in a SQLite file so every Streamlit session and process shares
+them. Each entry belongs to a namespace that names what produced it (for
+example the cleaning step plus the spaCy model version), so changing the
+producer never serves stale values. The least recently used entries are
+evicted once the stored values exceed MAX_BYTES.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+CACHE_PATH = os.path.join("cache", "text_cache.sqlite3")
+MAX_BYTES = 256 * 1024 * 1024
+
+
+def text_key(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class TextCache:
+    def __init__(self, path=CACHE_PATH, max_bytes=MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_access ON entries (last_access)")
+
+    def _connect(self):
+        # New connection per call: safe across Streamlit's script threads
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get_many(self, namespace, keys):
+        found = {}
+        keys = list(dict.fromkeys(keys))
+        with closing(self._connect()) as conn, conn:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT key, value FROM entries WHERE namespace = ? "
+                    f"AND key IN ({','.join('?' * len(chunk))})",
+                    [namespace, *chunk],
+                ).fetchall()
+                found.update(rows)
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE entries SET last_access = ? WHERE namespace = ? AND key = ?",
+                    [(now, namespace, k) for k in found],
+                )
+        return found
+
+    def put_many(self, namespace, items):
+        if not items:
+            return
+        now = time.time()
+        rows = [(namespace, k, v, len(v.encode("utf-8")), now) for k, v in items.items()]
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._evict(conn)
+
+    def _evict(self, conn):
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        doomed = []
+        with closing(conn.execute("SELECT rowid, size FROM entries ORDER BY last_access")) as rows:
+            for rowid, size in rows:
+                doomed.append((rowid,))
+                excess -= size
+                if excess <= 0:
+                    break
+        conn.executemany("DELETE FROM entries WHERE rowid = ?", doomed)
+
+    def stats(self):
+        with closing(self._connect()) as conn:
+            count, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {"entries": count, "bytes": total}
+
+
+def cached_batch(cache, namespace, texts, compute_batch, encode=str, decode=str):
+    """Look up each text's derived value; compute only the misses, in one batch."""
+    keys = [text_key(t) for t in texts]
+    values = {k: decode(v) for k, v in cache.get_many(namespace, keys).items()}
+    missing = {k: t for k, t in zip(keys, texts) if k not in values}
+    if missing:
+        computed = dict(zip(missing, compute_batch(list(missing.values()))))
+        cache.put_many(namespace, {k: encode(v) for k, v in computed.items()})
+        values.update(computed)
+    return [values[k] for k in keys]
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_text_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TextCache()
+        return _cache
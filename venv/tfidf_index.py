@@ -0,0 +1,264 @@
+# tfidf_index.py
+"""Persistent TF-IDF index over every resume the app has screened.
+
+The vocabulary and IDF weights are fitted on the resume corpus and saved to
+disk together with the CSR matrix of resume vectors. New resumes are
+transformed with the saved vocabulary and appended. While the last fit saw
+fewer than AUTO_REFIT_DOCS resumes, ``add`` refits once the corpus has
+outgrown it, so a first batch of one or two resumes does not fix the
+vocabulary for good; past that, refitting is an explicit operation. A job
+description query is a single transform plus one sparse matrix product, and
+a resume's score no longer depends on which other resumes were uploaded
+with it.
+
+On disk each fit has its own directory: base.pkl holds the vectorizer and
+the rows it was fitted on, and every later ``add`` writes one more segment
+file, so adding costs only the new rows. Segment names are claimed with an
+exclusive link, so processes adding to the same fit never overwrite each
+other. The CURRENT file names the live fit directory and is replaced last,
+so a crash never pairs a vectorizer with rows from another fit; the fit it
+replaced is kept for processes still adding to it, and older ones removed.
+"""
+import hashlib
+import os
+import pickle
+import shutil
+import threading
+import uuid
+
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+INDEX_DIR = "tfidf_index"
+# Suggest a refit once the corpus has grown by this fraction since the last fit
+REFIT_GROWTH_RATIO = 0.5
+# Below this many resumes at the last fit, add refits by itself once a refit is due
+AUTO_REFIT_DOCS = 200
+
+
+def doc_id(raw_text):
+    """Content hash identifying a resume in the index."""
+    return hashlib.sha256(raw_text.encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path, write):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+class TfidfIndex:
+    def __init__(self, index_dir=INDEX_DIR):
+        self.index_dir = index_dir
+        self.vectorizer = None
+        self.doc_ids = []
+        self.cleaned_texts = []
+        self.fitted_count = 0
+        # Changes on every fit; vectors made with another fit_id are stale
+        self.fit_id = None
+        self._blocks = []
+        self._segments = 0
+        self._positions = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _path(self, *names):
+        return os.path.join(self.index_dir, *names)
+
+    def _fit_dir(self, fit_id=None):
+        return self._path(f"fit-{fit_id or self.fit_id}")
+
+    @property
+    def matrix(self):
+        # Rows added since the last query are stacked on demand
+        if len(self._blocks) > 1:
+            self._blocks = [sparse.vstack(self._blocks, format="csr")]
+        return self._blocks[0] if self._blocks else None
+
+    def _load(self):
+        if not os.path.exists(self._path("CURRENT")):
+            self._import_legacy_files()
+            return
+        with open(self._path("CURRENT"), "r", encoding="utf-8") as f:
+            self.fit_id = f.read().strip()
+        with open(os.path.join(self._fit_dir(), "base.pkl"), "rb") as f:
+            base = pickle.load(f)
+        self.vectorizer = base["vectorizer"]
+        self.fitted_count = base["fitted_count"]
+        self._append_rows(base["doc_ids"], base["cleaned_texts"], base["matrix"])
+        # Half-written segments keep their .tmp suffix and are skipped
+        segments = sorted(
+            name for name in os.listdir(self._fit_dir())
+            if name.startswith("segment-") and name.endswith(".pkl")
+        )
+        for name in segments:
+            with open(os.path.join(self._fit_dir(), name), "rb") as f:
+                segment = pickle.load(f)
+            self._append_rows(segment["doc_ids"], segment["cleaned_texts"], segment["matrix"])
+        self._segments = len(segments)
+
+    def _import_legacy_files(self):
+        """Moves an index saved as loose vectorizer/matrix/docs files into a fit directory."""
+        if not os.path.exists(self._path("docs.pkl")):
+            return
+        with open(self._path("vectorizer.pkl"), "rb") as f:
+            self.vectorizer = pickle.load(f)
+        with open(self._path("docs.pkl"), "rb") as f:
+            docs = pickle.load(f)
+        self.fitted_count = docs["fitted_count"]
+        self.fit_id = docs.get("fit_id") or uuid.uuid4().hex
+        self._append_rows(docs["doc_ids"], docs["cleaned_texts"], sparse.load_npz(self._path("matrix.npz")).tocsr())
+        self._save_fit()
+        for name in ("vectorizer.pkl", "matrix.npz", "docs.pkl"):
+            os.remove(self._path(name))
+
+    def _append_rows(self, doc_ids, cleaned_texts, matrix):
+        for d, t in zip(doc_ids, cleaned_texts):
+            self._positions[d] = len(self.doc_ids)
+            self.doc_ids.append(d)
+            self.cleaned_texts.append(t)
+        self._blocks.append(matrix.tocsr())
+
+    def _current_fit_id(self):
+        try:
+            with open(self._path("CURRENT"), "r", encoding="utf-8") as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            return None
+
+    def _save_fit(self):
+        """Writes the whole index as a new fit directory, then points CURRENT at it."""
+        fit_dir = self._fit_dir()
+        previous = self._current_fit_id()
+        os.makedirs(fit_dir, exist_ok=True)
+        base = {
+            "vectorizer": self.vectorizer,
+            "doc_ids": self.doc_ids,
+            "cleaned_texts": self.cleaned_texts,
+            "fitted_count": self.fitted_count,
+            "matrix": self.matrix,
+        }
+        _atomic_write(os.path.join(fit_dir, "base.pkl"), lambda f: pickle.dump(base, f))
+        _atomic_write(self._path("CURRENT"), lambda f: f.write(self.fit_id.encode("utf-8")))
+        self._segments = 0
+        # Other processes may still be adding to the fit just replaced; older ones are unreachable
+        keep = {os.path.basename(fit_dir), os.path.basename(self._fit_dir(previous))}
+        for name in os.listdir(self.index_dir):
+            if name.startswith("fit-") and name not in keep:
+                shutil.rmtree(self._path(name), ignore_errors=True)
+
+    def _save_segment(self, doc_ids, cleaned_texts, matrix):
+        """Writes only the newly added rows, as the next free segment of the current fit."""
+        segment = {"doc_ids": doc_ids, "cleaned_texts": cleaned_texts, "matrix": matrix}
+        tmp_path = os.path.join(self._fit_dir(), f"segment-{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(segment, f)
+        try:
+            while True:
+                self._segments += 1
+                path = os.path.join(self._fit_dir(), f"segment-{self._segments:06d}.pkl")
+                try:
+                    # Unlike a rename, a link fails if another process took the name first
+                    os.link(tmp_path, path)
+                    break
+                except FileExistsError:
+                    continue
+        finally:
+            os.remove(tmp_path)
+
+    def __len__(self):
+        return len(self.doc_ids)
+
+    def __contains__(self, doc):
+        return doc in self._positions
+
+    def cleaned_text(self, doc):
+        return self.cleaned_texts[self._positions[doc]]
+
+    def add(self, doc_ids, cleaned_texts):
+        """Index new resumes with the saved vocabulary; the first batch fits it.
+
+        While the last fit is small, a batch that makes a refit due refits
+        the whole corpus instead of being transformed.
+        """
+        with self._lock:
+            new_docs = [
+                (d, t) for d, t in dict(zip(doc_ids, cleaned_texts)).items()
+                if d not in self._positions
+            ]
+            if not new_docs:
+                return
+            new_ids = [d for d, _ in new_docs]
+            new_texts = [t for _, t in new_docs]
+
+            grown = len(self) + len(new_ids) - self.fitted_count
+            small_refit_due = (
+                self.fitted_count < AUTO_REFIT_DOCS
+                and grown > REFIT_GROWTH_RATIO * max(self.fitted_count, 1)
+            )
+            if self.vectorizer is None or small_refit_due:
+                # _fit rebuilds every row, so the placeholder rows are never read
+                self._append_rows(new_ids, new_texts, sparse.csr_matrix((len(new_ids), 0)))
+                self._fit()
+                self._save_fit()
+            else:
+                new_rows = self.vectorizer.transform(new_texts).tocsr()
+                self._save_segment(new_ids, new_texts, new_rows)
+                self._append_rows(new_ids, new_texts, new_rows)
+
+    def _fit(self):
+        self.vectorizer = TfidfVectorizer()
+        self._blocks = [self.vectorizer.fit_transform(self.cleaned_texts).tocsr()]
+        self.fitted_count = len(self.doc_ids)
+        self.fit_id = uuid.uuid4().hex
+
+    def refit(self):
+        """Re-learn vocabulary and IDF from the whole corpus and rebuild the matrix."""
+        with self._lock:
+            if self.doc_ids:
+                self._fit()
+                self._save_fit()
+
+    def needs_refit(self):
+        return len(self) - self.fitted_count > REFIT_GROWTH_RATIO * max(self.fitted_count, 1)
+
+    def transform(self, cleaned_texts):
+        """TF-IDF rows for texts under the current fit, or None before the first fit."""
+        with self._lock:
+            if self.vectorizer is None:
+                return None
+            return self.vectorizer.transform(cleaned_texts).tocsr()
+
+    def vectors(self, doc_ids):
+        """Stored TF-IDF rows of the given indexed resumes, in order."""
+        with self._lock:
+            return self.matrix[[self._positions[d] for d in doc_ids]]
+
+    def scores(self, doc_ids, cleaned_query=None, query_vector=None):
+        """Cosine similarity of the query against the given indexed resumes.
+
+        Pass either the cleaned query text or a vector from ``transform``
+        made under the current fit.
+        """
+        with self._lock:
+            rows = self.matrix[[self._positions[d] for d in doc_ids]]
+            query = (
+                query_vector if query_vector is not None
+                else self.vectorizer.transform([cleaned_query])
+            )
+        # TF-IDF rows are L2-normalized, so the dot product is the cosine
+        return (rows @ query.T).toarray().ravel()
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index():
+    """Process-wide index shared by every Streamlit session."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = TfidfIndex()
+        return _index